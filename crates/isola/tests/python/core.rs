@@ -178,6 +178,155 @@ async fn integration_python_self_rescheduling_callback_does_not_starve_timer() -
     Ok(())
 }
 
+#[tokio::test]
+#[cfg_attr(debug_assertions, ignore = "integration tests run in release mode")]
+async fn integration_python_cancelled_timers_keep_pending_waits_intact() -> Result<()> {
+    let Some(module) = build_module().await? else {
+        return Ok(());
+    };
+    let mut sandbox = module
+        .instantiate(TestHost::default(), SandboxOptions::default())
+        .await
+        .context("failed to instantiate sandbox")?;
+
+    // Cancelling a timer swaps the last pending wait into its slot; cover a
+    // host call being moved, a timer being moved, and the last slot itself.
+    sandbox
+        .eval_script(
+            "import asyncio\n\
+             from sandbox.asyncio import hostcall\n\
+             async def main():\n\
+             \tloop = asyncio.get_running_loop()\n\
+             \tfired = []\n\
+             \tearly = [loop.call_later(0.01, fired.append, i) for i in range(2)]\n\
+             \tdelayed = asyncio.ensure_future(hostcall('delay', 30))\n\
+             \tawait asyncio.sleep(0)\n\
+             \tearly[1].cancel()\n\
+             \tlate = [loop.call_later(0.02, fired.append, i) for i in range(2, 6)]\n\
+             \tearly[0].cancel()\n\
+             \tlate[-1].cancel()\n\
+             \tlate[1].cancel()\n\
+             \tawait asyncio.sleep(0.05)\n\
+             \treturn [sorted(fired), await delayed]",
+            OutputTarget::discard(),
+        )
+        .await
+        .context("failed to evaluate timer cancellation script")?;
+
+    let output = call_with_timeout(&mut sandbox, "main", [], Duration::from_secs(2))
+        .await
+        .context("timer cancellation stalled the loop")?;
+    let (fired, delayed): (Vec<i64>, i64) = output
+        .result
+        .as_ref()
+        .context("expected end output")?
+        .to_serde()
+        .context("failed to decode timer cancellation result")?;
+
+    assert_eq!(fired, vec![2, 4]);
+    assert_eq!(delayed, 30);
+
+    Ok(())
+}
+
+#[tokio::test]
+#[cfg_attr(debug_assertions, ignore = "integration tests run in release mode")]
+async fn integration_python_timers_due_together_fire_alongside_hostcalls() -> Result<()> {
+    let Some(module) = build_module().await? else {
+        return Ok(());
+    };
+    let mut sandbox = module
+        .instantiate(TestHost::default(), SandboxOptions::default())
+        .await
+        .context("failed to instantiate sandbox")?;
+
+    sandbox
+        .eval_script(
+            "import asyncio\n\
+             from sandbox.asyncio import hostcall\n\
+             async def main():\n\
+             \tloop = asyncio.get_running_loop()\n\
+             \tfired = []\n\
+             \tfor i in range(8):\n\
+             \t\tloop.call_later(0.01, fired.append, i)\n\
+             \tresults = await asyncio.gather(\n\
+             \t\thostcall('delay', 5), asyncio.sleep(0.02, 20), hostcall('delay', 25)\n\
+             \t)\n\
+             \treturn [sorted(fired), results]",
+            OutputTarget::discard(),
+        )
+        .await
+        .context("failed to evaluate concurrent timer script")?;
+
+    let output = call_with_timeout(&mut sandbox, "main", [], Duration::from_secs(2))
+        .await
+        .context("concurrent timers stalled the loop")?;
+    let (fired, results): (Vec<i64>, Vec<i64>) = output
+        .result
+        .as_ref()
+        .context("expected end output")?
+        .to_serde()
+        .context("failed to decode concurrent timer result")?;
+
+    assert_eq!(fired, (0..8).collect::<Vec<_>>());
+    assert_eq!(results, vec![5, 20, 25]);
+
+    Ok(())
+}
+
+#[tokio::test]
+#[cfg_attr(debug_assertions, ignore = "integration tests run in release mode")]
+async fn integration_python_stop_with_pending_hostcall_ends_turn() -> Result<()> {
+    let Some(module) = build_module().await? else {
+        return Ok(());
+    };
+    let mut sandbox = module
+        .instantiate(TestHost::default(), SandboxOptions::default())
+        .await
+        .context("failed to instantiate sandbox")?;
+
+    sandbox
+        .eval_script(
+            "import asyncio\n\
+             from sandbox.asyncio import hostcall\n\
+             async def main():\n\
+             \tloop = asyncio.get_running_loop()\n\
+             \tpending = asyncio.ensure_future(hostcall('delay', 50))\n\
+             \tawait asyncio.sleep(0)\n\
+             \tloop.stop()\n\
+             \tawait pending\n\
+             async def after():\n\
+             \treturn await hostcall('delay', 1)",
+            OutputTarget::discard(),
+        )
+        .await
+        .context("failed to evaluate loop stop script")?;
+
+    let err = call_with_timeout(&mut sandbox, "main", [], Duration::from_secs(2))
+        .await
+        .expect_err("expected stopped loop to fail the call");
+    let IsolaError::UserCode { message } = err else {
+        panic!("expected guest error, got {err:?}");
+    };
+    assert!(
+        message.contains("Event loop stopped before Future completed"),
+        "unexpected error message: {message}",
+    );
+
+    let output = call_with_timeout(&mut sandbox, "after", [], Duration::from_secs(2))
+        .await
+        .context("sandbox did not recover after loop stop")?;
+    let value: i64 = output
+        .result
+        .as_ref()
+        .context("expected end output")?
+        .to_serde()
+        .context("failed to decode follow-up result")?;
+    assert_eq!(value, 1);
+
+    Ok(())
+}
+
 #[tokio::test]
 #[cfg_attr(debug_assertions, ignore = "integration tests run in release mode")]
 async fn integration_python_output_target_does_not_retain_refs() -> Result<()> {
@@ -384,6 +384,92 @@ def main(url):
     Ok(())
 }
 
+#[tokio::test]
+#[cfg_attr(debug_assertions, ignore = "integration tests run in release mode")]
+async fn integration_python_http_generator_body_and_closed_upload() -> Result<()> {
+    let Some(module) = build_module().await? else {
+        return Ok(());
+    };
+
+    let server = MockServer::start().await;
+    Mock::given(method("POST"))
+        .and(path("/chunks"))
+        .and(body_string("hello world"))
+        .respond_with(ResponseTemplate::new(200))
+        .expect(1)
+        .mount(&server)
+        .await;
+    Mock::given(method("POST"))
+        .and(path("/multipart"))
+        .and(body_string_contains(r#"name="file"; filename="a.txt""#))
+        .and(body_string_contains("\r\n\r\nclosed-later\r\n"))
+        .respond_with(ResponseTemplate::new(201))
+        .expect(1)
+        .mount(&server)
+        .await;
+
+    let mut sandbox = module
+        .instantiate(TestHost::default(), SandboxOptions::default())
+        .await
+        .context("failed to instantiate sandbox")?;
+
+    let script = r#"
+import io
+from sandbox.http import fetch
+
+def chunks():
+    yield b"hello "
+    yield b"world"
+
+def main(url):
+    with fetch("POST", f"{url}/chunks", body=chunks()) as resp:
+        chunked = resp.status
+
+    upload = io.BytesIO(b"closed-later")
+    request = fetch(
+        "POST", f"{url}/multipart", files={"file": ("a.txt", upload, "text/plain")}
+    )
+    upload.close()
+    with request as resp:
+        closed = resp.status
+
+    try:
+        with fetch("POST", f"{url}/chunks", body=io.BytesIO(b"raw")):
+            pass
+    except TypeError:
+        rejected = True
+    else:
+        rejected = False
+    return [chunked, closed, rejected]
+"#;
+    sandbox
+        .eval_script(script, OutputTarget::discard())
+        .await
+        .context("failed to evaluate request body script")?;
+
+    let url_arg = server.uri();
+    let output = call_with_timeout(
+        &mut sandbox,
+        "main",
+        args![url_arg]?,
+        Duration::from_secs(5),
+    )
+    .await
+    .context("failed to call request body function")?;
+
+    let (chunked, closed, rejected): (i64, i64, bool) = output
+        .result
+        .as_ref()
+        .context("expected exactly one end output")?
+        .to_serde()
+        .context("failed to decode request body result")?;
+    assert_eq!(chunked, 200);
+    assert_eq!(closed, 201);
+    assert!(rejected, "file objects must not be accepted as a raw body");
+
+    Ok(())
+}
+
 #[tokio::test]
 #[cfg_attr(debug_assertions, ignore = "integration tests run in release mode")]
 async fn integration_python_http_read_twice_errors() -> Result<()> {
@@ -513,3 +599,165 @@ def main(url):
 
     Ok(())
 }
+
+#[tokio::test]
+#[cfg_attr(debug_assertions, ignore = "integration tests run in release mode")]
+async fn integration_python_http_importer_preload() -> Result<()> {
+    let Some(module) = build_module().await? else {
+        return Ok(());
+    };
+
+    let server = MockServer::start().await;
+    Mock::given(method("GET"))
+        .and(path("/mods"))
+        .respond_with(ResponseTemplate::new(200).set_body_string("index"))
+        .mount(&server)
+        .await;
+    // Preloaded modules are served from memory by the import that follows.
+    Mock::given(method("GET"))
+        .and(path("/mods/helpers.py"))
+        .respond_with(ResponseTemplate::new(200).set_body_string("answer = 42\n"))
+        .expect(1)
+        .mount(&server)
+        .await;
+    // The first fetch fails during preload; the import must try again.
+    Mock::given(method("GET"))
+        .and(path("/mods/flaky.py"))
+        .respond_with(ResponseTemplate::new(503))
+        .up_to_n_times(1)
+        .with_priority(1)
+        .expect(1)
+        .mount(&server)
+        .await;
+    Mock::given(method("GET"))
+        .and(path("/mods/flaky.py"))
+        .respond_with(ResponseTemplate::new(200).set_body_string("value = 'recovered'\n"))
+        .expect(1)
+        .mount(&server)
+        .await;
+
+    let mut sandbox = module
+        .instantiate(TestHost::default(), SandboxOptions::default())
+        .await
+        .context("failed to instantiate sandbox")?;
+
+    let script = r#"
+from sandbox.importlib import http
+
+async def main(url):
+    with http(f"{url}/mods") as importer:
+        await importer.preload(["helpers", "flaky"])
+        import helpers
+        import flaky
+    return [helpers.answer, flaky.value]
+"#;
+    sandbox
+        .eval_script(script, OutputTarget::discard())
+        .await
+        .context("failed to evaluate preload script")?;
+
+    let url_arg = server.uri();
+    let output = call_with_timeout(
+        &mut sandbox,
+        "main",
+        args![url_arg]?,
+        Duration::from_secs(5),
+    )
+    .await
+    .context("failed to call preload function")?;
+
+    let (answer, value): (i64, String) = output
+        .result
+        .as_ref()
+        .context("expected exactly one end output")?
+        .to_serde()
+        .context("failed to decode preload result")?;
+    assert_eq!(answer, 42);
+    assert_eq!(value, "recovered");
+
+    Ok(())
+}
+
+#[tokio::test]
+#[cfg_attr(debug_assertions, ignore = "integration tests run in release mode")]
+async fn integration_python_http_importer_invalidate_caches_forgets_misses() -> Result<()> {
+    let Some(module) = build_module().await? else {
+        return Ok(());
+    };
+
+    let server = MockServer::start().await;
+    Mock::given(method("GET"))
+        .and(path("/mods"))
+        .respond_with(ResponseTemplate::new(200).set_body_string("index"))
+        .mount(&server)
+        .await;
+    // Both candidate paths are fetched once for the first import; the repeat
+    // import is answered from the miss cache.
+    Mock::given(method("GET"))
+        .and(path("/mods/late.py"))
+        .respond_with(ResponseTemplate::new(404))
+        .up_to_n_times(1)
+        .with_priority(1)
+        .expect(1)
+        .mount(&server)
+        .await;
+    Mock::given(method("GET"))
+        .and(path("/mods/late/__init__.py"))
+        .respond_with(ResponseTemplate::new(404))
+        .expect(1)
+        .mount(&server)
+        .await;
+    Mock::given(method("GET"))
+        .and(path("/mods/late.py"))
+        .respond_with(ResponseTemplate::new(200).set_body_string("value = 'published'\n"))
+        .expect(1)
+        .mount(&server)
+        .await;
+
+    let mut sandbox = module
+        .instantiate(TestHost::default(), SandboxOptions::default())
+        .await
+        .context("failed to instantiate sandbox")?;
+
+    let script = r#"
+import importlib
+from sandbox.importlib import http
+
+def main(url):
+    with http(f"{url}/mods"):
+        misses = 0
+        for _ in range(2):
+            try:
+                import late
+            except ImportError:
+                misses += 1
+        importlib.invalidate_caches()
+        import late
+    return [misses, late.value]
+"#;
+    sandbox
+        .eval_script(script, OutputTarget::discard())
+        .await
+        .context("failed to evaluate invalidate_caches script")?;
+
+    let url_arg = server.uri();
+    let output = call_with_timeout(
+        &mut sandbox,
+        "main",
+        args![url_arg]?,
+        Duration::from_secs(5),
+    )
+    .await
+    .context("failed to call invalidate_caches function")?;
+
+    let (misses, value): (i64, String) = output
+        .result
+        .as_ref()
+        .context("expected exactly one end output")?
+        .to_serde()
+        .context("failed to decode invalidate_caches result")?;
+    assert_eq!(misses, 2);
+    assert_eq!(value, "published");
+
+    Ok(())
+}
@@ -4,6 +4,7 @@ import asyncio
 import contextlib
 import logging
 import sys
+import types
 import weakref
 from collections import deque
 from typing import TYPE_CHECKING, Unpack, cast, overload, override
@@ -41,40 +42,67 @@ async def subscribe[T](
     assert isinstance(loop, PollLoop), (
         "subscribe() must be called from a PollLoop context"
     )
-    return await loop.subscribe(fut)
+    subscription = fut.subscribe()
+    if subscription is None:
+        # Already complete: read the result in place instead of resolving a
+        # waker future that would be awaited without ever suspending.
+        try:
+            return fut.get()
+        finally:
+            fut.release()
+    return await loop._wait(fut, subscription)  # ruff:ignore[private-member-access]
 
 
 class PollLoop(asyncio.AbstractEventLoop):
     __slots__: tuple[str, ...] = (
         "_asyncgens",
         "_finalizing_asyncgens",
+        "_host_waits",
+        "_timer_slots",
         "closed",
         "handles",
+        "pollables",
         "running",
+        "subscriptions",
         "wakers",
     )
 
     def __init__(self) -> None:
-        self.wakers: list[
-            tuple[
-                _isola_sys.Pollable[None],
-                _isola_sys.Pollable[object],
-                asyncio.Future[object] | asyncio.Handle,
-            ]
-        ] = []
+        # Pending waits are kept as parallel lists: `ready()` scans the
+        # subscriptions on their own and every other pass indexes all three.
+        self.subscriptions: list[_isola_sys.Pollable[None]] = []
+        self.pollables: list[_isola_sys.Pollable[object]] = []
+        self.wakers: list[asyncio.Future[object] | asyncio.Handle] = []
         self.running: bool = False
         self.closed: bool = False
         self.handles: deque[asyncio.Handle] = deque()
         self._asyncgens: weakref.WeakSet[AsyncGenerator[object]] = weakref.WeakSet()
         self._finalizing_asyncgens: set[AsyncGenerator[object]] = set()
+        # id() of each timer handle in `wakers` -> its index, so cancelling a
+        # timer does not have to scan every pending waker.
+        self._timer_slots: dict[int, int] = {}
+        # Number of entries in `wakers` that wait on a host operation rather
+        # than a timer.
+        self._host_waits = 0
 
     def subscribe[T](self, pollable: _isola_sys.Pollable[T]) -> asyncio.Future[T]:
-        waker = self.create_future()
         subscription = pollable.subscribe()
         if subscription is None:
+            waker = self.create_future()
             self._resume_future(pollable, waker)
-        else:
-            self.wakers.append((subscription, pollable, waker))
+            return cast("asyncio.Future[T]", waker)
+        return self._wait(pollable, subscription)
+
+    def _wait[T](
+        self,
+        pollable: _isola_sys.Pollable[T],
+        subscription: _isola_sys.Pollable[None],
+    ) -> asyncio.Future[T]:
+        waker = self.create_future()
+        self.subscriptions.append(subscription)
+        self.pollables.append(pollable)
+        self.wakers.append(waker)
+        self._host_waits += 1
         return cast("asyncio.Future[T]", waker)
 
     @override
@@ -165,86 +193,130 @@ class PollLoop(asyncio.AbstractEventLoop):
     def _run_until_complete[T](
         self, future: Awaitable[T], *, suspend: bool = False
     ) -> T:
-        task = cast("asyncio.Future[T]", asyncio.ensure_future(future, loop=self))
+        # Runner.run() hands over a task already bound to this loop; only
+        # fall back to ensure_future() for other awaitables.
+        task: asyncio.Future[T]
+        if isinstance(future, asyncio.Future) and future.get_loop() is self:
+            task = future
+        elif asyncio.iscoroutine(future):
+            task = asyncio.Task(future, loop=self)
+        else:
+            task = asyncio.ensure_future(future, loop=self)
+        # Bound once per call; step() runs on every wakeup.
+        task_done = task.done
+        subscriptions = self.subscriptions
+        wakers = self.wakers
+        handles = self.handles
+        popleft = handles.popleft
+        ready = _isola_sys.ready
+        release_cancelled_wakers = self._release_cancelled_wakers
+        dispatch_ready = self._dispatch_ready
 
         def step() -> bool:
             while True:
-                self._release_cancelled_wakers()
+                release_cancelled_wakers()
                 servicing_ready = False
-                waiting_before_callbacks = False
-                if self.wakers:
-                    readyset = _isola_sys.ready(self.wakers)
+                if wakers:
+                    readyset = ready(subscriptions)
                     servicing_ready = any(readyset)
-                    self._dispatch_ready(readyset)
-                    waiting_before_callbacks = bool(self.wakers)
+                    dispatch_ready(readyset)
+                # Timers are checked against the clock on every pass; only
+                # host operations need the driver to run before they finish.
+                waiting_on_host = self._host_waits > 0
                 if not self.running:
                     return False
-                if task.done():
-                    # Match asyncio.run_until_complete(): callbacks queued in the
-                    # task's final turn run once before the loop stops. Work they
-                    # enqueue is left for shutdown instead of extending the turn.
-                    for _ in range(len(self.handles)):
-                        handle = self.handles.popleft()
-                        if not handle._cancelled:  # ruff:ignore[private-member-access]
-                            handle._run()  # ruff:ignore[private-member-access]
-                    return False
-                if not self.handles:
+                if task_done():
                     break
-                for _ in range(len(self.handles)):
-                    handle = self.handles.popleft()
+                if not handles:
+                    return bool(wakers)
+                for _ in range(len(handles)):
+                    handle = popleft()
                     if not handle._cancelled:  # ruff:ignore[private-member-access]
                         handle._run()  # ruff:ignore[private-member-access]
-                if waiting_before_callbacks and not servicing_ready:
+                if task_done():
                     break
-
-            if task.done() or not self.running:
-                return False
-            return bool(self.wakers)
+                if not self.running:
+                    return False
+                if waiting_on_host and not servicing_ready:
+                    # Let in-flight host operations progress before the next batch.
+                    return True
+
+            # Match asyncio.run_until_complete(): callbacks queued in the task's
+            # final turn run once before the loop stops. Work they enqueue is
+            # left for shutdown instead of extending the turn.
+            for _ in range(len(handles)):
+                handle = popleft()
+                if not handle._cancelled:  # ruff:ignore[private-member-access]
+                    handle._run()  # ruff:ignore[private-member-access]
+            return False
 
         _isola_sys.drive(step, suspend)
 
-        if not task.done() and self.running:
-            msg = "Deadlock detected"
+        if not task.done():
+            if self.running:
+                msg = "Deadlock detected"
+                raise RuntimeError(msg)
+            msg = "Event loop stopped before Future completed."
             raise RuntimeError(msg)
         return task.result()
 
+    # Both passes below compact the waiter lists in place: entries that stay
+    # pending are shifted down behind a write cursor and the tails are dropped
+    # at the end.
+
     def _release_cancelled_wakers(self) -> None:
-        active: list[
-            tuple[
-                _isola_sys.Pollable[None],
-                _isola_sys.Pollable[object],
-                asyncio.Future[object] | asyncio.Handle,
-            ]
-        ] = []
-        for subscription, pollable, waker in self.wakers:
+        subscriptions = self.subscriptions
+        pollables = self.pollables
+        wakers = self.wakers
+        timer_slots = self._timer_slots
+        kept = 0
+        for i in range(len(wakers)):
+            waker = wakers[i]
             if waker.cancelled():
-                pollable.release()
-                subscription.release()
-            else:
-                active.append((subscription, pollable, waker))
-        self.wakers = active
+                pollables[i].release()
+                subscriptions[i].release()
+                if isinstance(waker, asyncio.Handle):
+                    _ = timer_slots.pop(id(waker), None)
+                else:
+                    self._host_waits -= 1
+                continue
+            if kept != i:
+                if isinstance(waker, asyncio.Handle):
+                    timer_slots[id(waker)] = kept
+                subscriptions[kept] = subscriptions[i]
+                pollables[kept] = pollables[i]
+                wakers[kept] = waker
+            kept += 1
+        del subscriptions[kept:], pollables[kept:], wakers[kept:]
 
     def _dispatch_ready(self, readyset: bytes) -> None:
-        new_wakers: list[
-            tuple[
-                _isola_sys.Pollable[None],
-                _isola_sys.Pollable[object],
-                asyncio.Future[object] | asyncio.Handle,
-            ]
-        ] = []
-        for is_ready, (subscription, pollable, waker) in zip(
-            readyset, self.wakers, strict=True
-        ):
-            if not is_ready:
-                new_wakers.append((subscription, pollable, waker))
+        subscriptions = self.subscriptions
+        pollables = self.pollables
+        wakers = self.wakers
+        timer_slots = self._timer_slots
+        schedule = self.handles.append
+        resume_future = self._resume_future
+        kept = 0
+        for i in range(len(wakers)):
+            waker = wakers[i]
+            if not readyset[i]:
+                if kept != i:
+                    if isinstance(waker, asyncio.Handle):
+                        timer_slots[id(waker)] = kept
+                    subscriptions[kept] = subscriptions[i]
+                    pollables[kept] = pollables[i]
+                    wakers[kept] = waker
+                kept += 1
             elif isinstance(waker, asyncio.Handle):
-                pollable.release()
-                subscription.release()
-                self.handles.append(waker)
+                pollables[i].release()
+                subscriptions[i].release()
+                del timer_slots[id(waker)]
+                schedule(waker)
             else:
-                self._resume_future(pollable, waker)
-                subscription.release()
-        self.wakers = new_wakers
+                resume_future(pollables[i], waker)
+                subscriptions[i].release()
+                self._host_waits -= 1
+        del subscriptions[kept:], pollables[kept:], wakers[kept:]
 
     @staticmethod
     def _resume_future(
@@ -266,11 +338,19 @@ class PollLoop(asyncio.AbstractEventLoop):
     def _cleanup(self) -> None:
         while self.handles:
             self.handles.popleft().cancel()
-        for subscription, pollable, waker in self.wakers:
+        # Detach the wakers first: cancelling a timer handle calls back into
+        # _timer_handle_cancelled(), which must not reshuffle these lists.
+        subscriptions, self.subscriptions = self.subscriptions, []
+        pollables, self.pollables = self.pollables, []
+        wakers, self.wakers = self.wakers, []
+        self._timer_slots.clear()
+        self._host_waits = 0
+        for subscription, pollable, waker in zip(
+            subscriptions, pollables, wakers, strict=True
+        ):
             waker.cancel()
             pollable.release()
             subscription.release()
-        self.wakers.clear()
         # Cancelling futures may enqueue their done callbacks.
         while self.handles:
             handle = self.handles.popleft()
@@ -335,7 +415,10 @@ class PollLoop(asyncio.AbstractEventLoop):
             fut.release()
             self.handles.append(handle)
         else:
-            self.wakers.append((subscription, fut, handle))
+            self._timer_slots[id(handle)] = len(self.wakers)
+            self.subscriptions.append(subscription)
+            self.pollables.append(fut)
+            self.wakers.append(handle)
         return handle
 
     @override
@@ -349,16 +432,24 @@ class PollLoop(asyncio.AbstractEventLoop):
         return self.call_later(when - self.time(), callback, *args, context=context)
 
     def _timer_handle_cancelled(self, handle: asyncio.TimerHandle) -> None:
-        w = self.wakers
-        ln = len(w)
-        for i in range(ln):
-            subscription, pollable, waker = w[i]
-            if waker is handle:
-                pollable.release()
-                subscription.release()
-                w[i] = w[ln - 1]
-                _ = w.pop()
-                return
+        i = self._timer_slots.pop(id(handle), None)
+        if i is None:
+            return
+        subscriptions = self.subscriptions
+        pollables = self.pollables
+        wakers = self.wakers
+        pollables[i].release()
+        subscriptions[i].release()
+        # Swap the last waiter into the freed slot.
+        subscription = subscriptions.pop()
+        pollable = pollables.pop()
+        waker = wakers.pop()
+        if i < len(wakers):
+            subscriptions[i] = subscription
+            pollables[i] = pollable
+            wakers[i] = waker
+            if isinstance(waker, asyncio.Handle):
+                self._timer_slots[id(waker)] = i
 
     @override
     def time(self) -> float:
@@ -428,7 +519,8 @@ def run[T](main: _Coroutine[T]) -> T: ...
 @overload
 def run[T](main: AsyncGenerator[T]) -> Generator[T]: ...
 def run[T](main: _Coroutine[T] | AsyncGenerator[T]) -> T | Generator[T]:
-    if hasattr(main, "__aiter__"):
+    # Coroutines are the common case; skip the attribute probe for them.
+    if not isinstance(main, types.CoroutineType) and hasattr(main, "__aiter__"):
         return _iter(cast("AsyncGenerator[T]", main))
     with asyncio.Runner(loop_factory=PollLoop) as runner:
         return runner.run(cast("Coroutine[None, None, T]", main))
@@ -1,6 +1,6 @@
 from __future__ import annotations
 
-import binascii
+import functools
 import os
 from typing import IO, TYPE_CHECKING, Literal, NamedTuple, cast, final, overload
 
@@ -18,6 +18,10 @@ type _MethodType = Literal["GET", "POST", "PUT", "DELETE", "PATCH", "OPTIONS", "
 type _ResponseType = Literal["json", "text", "bytes"]
 type _IterResponseType = Literal["lines", "bytes", "sse"]
 
+_PART_NAME = b'\r\nContent-Disposition: form-data; name="'
+_PART_FILENAME = b'"; filename="'
+_PART_FILENAME_END = b'"\r\n'
+
 
 @final
 class Request:
@@ -78,6 +82,28 @@ class ServerSentEvent(NamedTuple):
     data: str
 
 
+# Event names come from a small vocabulary; share one string per name
+# instead of keeping a fresh copy alive in every event.
+_SSE_EVENT_CACHE_SIZE = 256
+_sse_events: dict[str, str] = {}
+
+
+def _sse_event(event: str | None) -> str | None:
+    if event is None:
+        return None
+    if (cached := _sse_events.get(event)) is not None:
+        return cached
+    if len(_sse_events) >= _SSE_EVENT_CACHE_SIZE:
+        _sse_events.clear()
+    _sse_events[event] = event
+    return event
+
+
+def _sse(item: object) -> ServerSentEvent:
+    id_, event, data = cast("tuple[str | None, str | None, str]", item)
+    return ServerSentEvent(id_, _sse_event(event), data)
+
+
 class _BaseResponse:
     __slots__: tuple[str, ...] = ("_headers", "_status", "resp")
 
@@ -86,32 +112,38 @@ class _BaseResponse:
         self._status: int | None = None
         self._headers: dict[str, str] | None = None
 
+    # close() drops the cached values, so a cache hit implies the response is
+    # still open and only a miss has to check.
     @property
     def status(self) -> int:
-        if self.resp is None:
-            msg = "Response is closed"
-            raise RuntimeError(msg)
-        if self._status is None:
-            self._status = self.resp.status()
-        return self._status
+        if (status := self._status) is None:
+            if self.resp is None:
+                msg = "Response is closed"
+                raise RuntimeError(msg)
+            status = self._status = self.resp.status()
+        return status
 
     @property
     def headers(self) -> dict[str, str]:
-        if self.resp is None:
-            msg = "Response is closed"
-            raise RuntimeError(msg)
-        if self._headers is None:
-            self._headers = self.resp.headers()
-        return self._headers
+        if (headers := self._headers) is None:
+            if self.resp is None:
+                msg = "Response is closed"
+                raise RuntimeError(msg)
+            headers = self._headers = self.resp.headers()
+        return headers
 
     def close(self) -> None:
         if self.resp:
             self.resp.close()
             self.resp = None
+            self._status = None
+            self._headers = None
 
 
 @final
 class AsyncResponse(_BaseResponse):
+    __slots__: tuple[str, ...] = ()
+
     @overload
     async def _aread(self, encoding: Literal["json"], size: int) -> object: ...
     @overload
@@ -122,8 +154,13 @@ class AsyncResponse(_BaseResponse):
         if self.resp is None:
             msg = "Response is closed"
             raise RuntimeError(msg)
+        if size < 0:
+            # The response body is already held natively, so a full read never
+            # waits; decode it in one call instead of looping over read_into().
+            return self.resp.blocking_read(encoding, size)
         buf = _http.new_buffer(encoding)
-        while (poll := self.resp.read_into(buf, size)) is not None:
+        read_into = self.resp.read_into
+        while (poll := read_into(buf, size)) is not None:
             await subscribe(poll)
         return buf.read_all()
 
@@ -138,35 +175,51 @@ class AsyncResponse(_BaseResponse):
 
     # async iterator methods
 
+    @overload
+    def _aiter(self, encoding: Literal["bytes"]) -> AsyncGenerator[bytes]: ...
+    @overload
+    def _aiter(self, encoding: Literal["lines"]) -> AsyncGenerator[str]: ...
     async def _aiter(self, encoding: _IterResponseType) -> AsyncGenerator[object]:
         if self.resp is None:
             msg = "Response is closed"
             raise RuntimeError(msg)
         buf = _http.new_buffer(encoding)
-        while (poll := self.resp.read_into(buf, 16384)) is not None:
-            while (data := buf.next()) is not None:
+        read_into = self.resp.read_into
+        next_item = buf.next
+        while (poll := read_into(buf, 16384)) is not None:
+            while (data := next_item()) is not None:
                 yield data
             await subscribe(poll)
-        while (data := buf.next()) is not None:
+        while (data := next_item()) is not None:
             yield data
 
-    async def aiter_bytes(self) -> AsyncGenerator[bytes]:
-        async for data in cast("AsyncGenerator[bytes]", self._aiter("bytes")):
-            yield data
+    def aiter_bytes(self) -> AsyncGenerator[bytes]:
+        return self._aiter("bytes")
 
-    async def aiter_lines(self) -> AsyncGenerator[str]:
-        async for line in cast("AsyncGenerator[str]", self._aiter("lines")):
-            yield line
+    def aiter_lines(self) -> AsyncGenerator[str]:
+        return self._aiter("lines")
 
     async def aiter_sse(self) -> AsyncGenerator[ServerSentEvent]:
-        async for id_, event, data in cast(
-            "AsyncGenerator[tuple[str,str,str]]", self._aiter("sse")
-        ):
-            yield ServerSentEvent(id_, event, data)
+        # Decoded in the same frame as the read loop rather than re-yielded
+        # through _aiter().
+        if self.resp is None:
+            msg = "Response is closed"
+            raise RuntimeError(msg)
+        buf = _http.new_buffer("sse")
+        read_into = self.resp.read_into
+        next_item = buf.next
+        while (poll := read_into(buf, 16384)) is not None:
+            while (item := next_item()) is not None:
+                yield _sse(item)
+            await subscribe(poll)
+        while (item := next_item()) is not None:
+            yield _sse(item)
 
 
 @final
 class Response(_BaseResponse):
+    __slots__: tuple[str, ...] = ()
+
     @overload
     def _read(self, encoding: Literal["json"], size: int) -> object: ...
     @overload
@@ -190,29 +243,43 @@ class Response(_BaseResponse):
 
     # sync iterator methods
 
+    @overload
+    def _iter(self, encoding: Literal["bytes"]) -> Generator[bytes]: ...
+    @overload
+    def _iter(self, encoding: Literal["lines"]) -> Generator[str]: ...
     def _iter(self, encoding: _IterResponseType) -> Generator[object]:
         if self.resp is None:
             msg = "Response is closed"
             raise RuntimeError(msg)
         buf = _http.new_buffer(encoding)
-        while (poll := self.resp.read_into(buf, 16384)) is not None:
-            while (data := buf.next()) is not None:
+        read_into = self.resp.read_into
+        next_item = buf.next
+        while (poll := read_into(buf, 16384)) is not None:
+            while (data := next_item()) is not None:
                 yield data
             poll.wait()
-        while (data := buf.next()) is not None:
+        while (data := next_item()) is not None:
             yield data
 
     def iter_bytes(self) -> Generator[bytes]:
-        return cast("Generator[bytes]", self._iter("bytes"))
+        return self._iter("bytes")
 
     def iter_lines(self) -> Generator[str]:
-        return cast("Generator[str]", self._iter("lines"))
+        return self._iter("lines")
 
     def iter_sse(self) -> Generator[ServerSentEvent]:
-        for id_, event, data in cast(
-            "Generator[tuple[str,str,str]]", self._iter("sse")
-        ):
-            yield ServerSentEvent(id_, event, data)
+        if self.resp is None:
+            msg = "Response is closed"
+            raise RuntimeError(msg)
+        buf = _http.new_buffer("sse")
+        read_into = self.resp.read_into
+        next_item = buf.next
+        while (poll := read_into(buf, 16384)) is not None:
+            while (item := next_item()) is not None:
+                yield _sse(item)
+            poll.wait()
+        while (item := next_item()) is not None:
+            yield _sse(item)
 
 
 def fetch(
@@ -226,44 +293,60 @@ def fetch(
     timeout: float | None = None,
     proxy: str | None = None,
 ) -> Request:
-    if files:
-        if body:
-            msg = "Cannot specify both files and body"
-            raise ValueError(msg)
-        body, ty = _encode_multipart_formdata(files)
-        if not headers:
-            headers = {}
-        headers["Content-Type"] = ty
-    if proxy:
-        if not headers:
-            headers = {}
-        headers["x-isola-proxy"] = proxy
+    if files or proxy:
+        # Copy once rather than writing into the caller's mapping.
+        headers = dict(headers) if headers else {}
+        if files:
+            if body:
+                msg = "Cannot specify both files and body"
+                raise ValueError(msg)
+            body, headers["Content-Type"] = _encode_multipart_formdata(files)
+        if proxy:
+            headers["x-isola-proxy"] = proxy
     return Request(method, url, params, headers, body, timeout)
 
 
-def _encode_multipart_formdata(fields: dict[str, _FileType]) -> tuple[bytes, str]:
-    b_boundary = binascii.hexlify(os.urandom(16))
-    boundary = b_boundary.decode()
-    b_boundary = b"--" + b_boundary
-    parts: list[bytes] = []
-
+def _encode_multipart_formdata(
+    fields: dict[str, _FileType],
+) -> tuple[Generator[bytes], str]:
+    boundary = os.urandom(16).hex()
+    # File objects are read here, while fetch() runs, so the caller may close
+    # them before the request is sent.
+    parts: list[tuple[str, str, bytes, str]] = []
     for field, value in fields.items():
         if isinstance(value, tuple):
             filename, fileobj, mime = value
         else:
             filename, fileobj, mime = field, value, "application/octet-stream"
-
-        content_disposition = (
-            f'Content-Disposition: form-data; name="{field}"; filename="{filename}"'
-        )
-        parts.extend((
-            b_boundary,
-            content_disposition.encode(),
-            f"Content-Type: {mime}".encode(),
-            b"",
-            fileobj if isinstance(fileobj, bytes) else fileobj.read(),
+        payload = fileobj if isinstance(fileobj, bytes) else fileobj.read()
+        parts.append((field, filename, payload, mime))
+    chunks = _multipart_chunks(parts, f"--{boundary}".encode("ascii"))
+    return chunks, f"multipart/form-data; boundary={boundary}"
+
+
+def _multipart_chunks(
+    parts: list[tuple[str, str, bytes, str]], b_boundary: bytes
+) -> Generator[bytes]:
+    # _http.fetch() copies these straight into the request buffer, which saves
+    # the Python-side join of the whole body.
+    part_start = b_boundary + _PART_NAME
+    for field, filename, payload, mime in parts:
+        yield b"".join((
+            part_start,
+            field.encode(),
+            _PART_FILENAME,
+            filename.encode(),
+            _PART_FILENAME_END,
         ))
+        yield _multipart_content_type(mime)
+        yield payload
+        yield b"\r\n"
+
+    yield b_boundary
+    yield b"--\r\n"
+
 
-    parts.extend((b_boundary + b"--", b""))
-    body = b"\r\n".join(parts)
-    return body, f"multipart/form-data; boundary={boundary}"
+# Uploads reuse a handful of MIME types; keep their encoded part headers.
+@functools.lru_cache(maxsize=64)
+def _multipart_content_type(mime: str) -> bytes:
+    return f"Content-Type: {mime}\r\n\r\n".encode()
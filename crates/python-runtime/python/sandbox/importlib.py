@@ -1,5 +1,6 @@
 from __future__ import annotations
 
+import asyncio
 import importlib.abc
 import importlib.resources.abc
 import importlib.util
@@ -14,12 +15,16 @@ from sandbox.http import fetch
 
 if TYPE_CHECKING:
     import types
-    from collections.abc import Callable, Sequence
+    from collections.abc import Callable, Iterable, Iterator, Sequence
     from importlib.machinery import ModuleSpec
 
 __all__ = ["http"]
 
 _module_type = cast("type[types.ModuleType]", type(sys))
+_PRELOAD_CONCURRENCY = 8
+_MISS_CACHE_SIZE = 256
+_ZIP_MAGIC = b"PK"
+_DEP_RE = re.compile(r"^([\w\-]+)(\[[^\]]+\])?(.*)$")
 
 
 @dataclass
@@ -38,15 +43,13 @@ class HttpImporter(
     def __init__(self, url: str) -> None:
         self.url: str = url
         self.modules: dict[str, ModuleInfo] = {}
+        # Names this importer has already failed to resolve. Every import
+        # consults each meta path finder, so misses would otherwise re-fetch.
+        # Cleared by invalidate_caches() and whenever it grows too large.
+        self._misses: set[str] = set()
         self.archive: zipfile.Path | None = None
         with fetch("GET", url) as r:
-            body = r.read()
-            if body.startswith(b"PK"):
-                try:
-                    zip_ = zipfile.ZipFile(io.BytesIO(body))
-                    self.archive = zipfile.Path(zip_)
-                except zipfile.BadZipfile:
-                    pass
+            self.archive = _read_archive(r.iter_bytes())
 
     @override
     def find_spec(
@@ -67,13 +70,10 @@ class HttpImporter(
     ) -> HttpImporter | None:
         if fullname in self.modules:
             return self
+        if fullname in self._misses:
+            return None
 
-        module_name: str = fullname.replace(".", "/")
-        paths: list[str] = [
-            module_name + ".py",
-            module_name + "/__init__.py",
-        ]
-        for path_entry in paths:
+        for path_entry in _candidate_paths(fullname):
             if self.archive is None:
                 url: str = self.url + "/" + path_entry
                 with fetch("GET", url) as resp:
@@ -88,17 +88,56 @@ class HttpImporter(
             else:
                 try:
                     self.modules[fullname] = ModuleInfo(
-                        content=(self.archive.joinpath(path_entry))
-                        .read_bytes()
-                        .decode(),
+                        content=self.archive.joinpath(path_entry).read_text(
+                            encoding="utf-8"
+                        ),
                         filepath=self.url + "#" + path_entry,
                         package=path_entry.endswith("__init__.py"),
                     )
                 except FileNotFoundError:
                     continue
                 return self
+        if len(self._misses) >= _MISS_CACHE_SIZE:
+            self._misses.clear()
+        self._misses.add(fullname)
         return None
 
+    @override
+    def invalidate_caches(self) -> None:
+        self._misses.clear()
+
+    async def preload(self, fullnames: Iterable[str]) -> None:
+        # Fetch several modules concurrently so the imports that follow are
+        # served from `self.modules`. Failures are not cached; the import
+        # itself retries and reports them.
+        if self.archive is not None:
+            return
+        limit = asyncio.Semaphore(_PRELOAD_CONCURRENCY)
+
+        async def _load(fullname: str) -> None:
+            async with limit:
+                for path_entry in _candidate_paths(fullname):
+                    url = self.url + "/" + path_entry
+                    async with fetch("GET", url) as resp:
+                        if resp.status >= 400:
+                            continue
+                        content = await resp.atext()
+                    self.modules[fullname] = ModuleInfo(
+                        content=content,
+                        filepath=url,
+                        package=path_entry.endswith("__init__.py"),
+                    )
+                    return
+
+        _ = await asyncio.gather(
+            *(
+                _load(name)
+                for name in set(fullnames)
+                if name not in self.modules and name not in self._misses
+            ),
+            return_exceptions=True,
+        )
+
     @override
     def get_source(self, fullname: str) -> str:
         if self._find_module(fullname) is not self:
@@ -139,6 +178,32 @@ class HttpImporter(
         return self.archive
 
 
+def _read_archive(chunks: Iterator[bytes]) -> zipfile.Path | None:
+    # Look at the first bytes before buffering anything: a module tree URL
+    # usually serves an index page that is not worth downloading in full.
+    head = b""
+    for chunk in chunks:
+        head += chunk
+        if len(head) >= len(_ZIP_MAGIC):
+            break
+    if not head.startswith(_ZIP_MAGIC):
+        return None
+
+    body = io.BytesIO(head)
+    _ = body.seek(0, io.SEEK_END)
+    for chunk in chunks:
+        _ = body.write(chunk)
+    try:
+        return zipfile.Path(zipfile.ZipFile(body))
+    except zipfile.BadZipfile:
+        return None
+
+
+def _candidate_paths(fullname: str) -> tuple[str, str]:
+    module_name = fullname.replace(".", "/")
+    return module_name + ".py", module_name + "/__init__.py"
+
+
 class RepoGuard[T: importlib.abc.MetaPathFinder, **P]:
     def __init__(self, cls: Callable[P, T], *args: P.args, **kwargs: P.kwargs) -> None:
         self.importer: T = cls(*args, **kwargs)
@@ -165,26 +230,22 @@ class _ParsedDependency(TypedDict):
 
 
 def _parse_dependency(dep: str) -> _ParsedDependency:
+    dep, has_marker, marker = dep.partition(";")
     result: _ParsedDependency = {
         "name": None,
         "version": None,
         "url": None,
         "extras": None,
-        "marker": None,
+        "marker": marker.strip() if has_marker else None,
     }
 
-    if ";" in dep:
-        dep, marker = dep.split(";", 1)
-        result["marker"] = marker.strip()
-
-    if "@" in dep:
-        name, url = dep.split("@", 1)
+    name, has_url, url = dep.partition("@")
+    if has_url:
         result["name"] = name.strip()
         result["url"] = url.strip()
         return result
 
-    extras_match = re.match(r"^([\w\-]+)(\[[^\]]+\])?(.*)$", dep.strip())
-    if extras_match:
+    if extras_match := _DEP_RE.match(dep.strip()):
         result["name"] = extras_match.group(1)
         if g := extras_match.group(2):
             result["extras"] = g[1:-1]
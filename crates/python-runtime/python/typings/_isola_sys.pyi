@@ -10,7 +10,7 @@ class ArgIter:
     def read(self) -> tuple[bool, object | None, Pollable[None] | None]: ...
 
 def monotonic() -> float: ...
-def ready(poll: Sequence[tuple[Pollable[None], Pollable[object], object]]) -> bytes: ...
+def ready(poll: Sequence[Pollable[None]]) -> bytes: ...
 def drive(step: Callable[[], bool], suspend: bool = False) -> None: ...
 def sleep(duration: float) -> Pollable[None]: ...
 def emit(obj: object) -> None: ...
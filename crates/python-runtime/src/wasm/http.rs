@@ -4,7 +4,8 @@ pub mod http_module {
     use isola_runtime::wasi_http::{HttpRequest, HttpResponse};
     use pyo3::{
         prelude::*,
-        types::{PyBytes, PyDict},
+        sync::PyOnceLock,
+        types::{PyBytes, PyDict, PyIterator},
     };
     use url::Url;
 
@@ -38,13 +39,30 @@ pub mod http_module {
         enum Body<'a> {
             None,
             Bytes(Bound<'a, PyBytes>),
+            Chunks(Bound<'a, PyIterator>),
             Object(Bound<'a, PyAny>),
         }
 
-        let body = body.map_or(Body::None, |body| {
-            body.extract::<Bound<'_, PyBytes>>()
-                .map_or(Body::Object(body.clone()), Body::Bytes)
-        });
+        static GENERATOR_TYPE: PyOnceLock<Py<PyAny>> = PyOnceLock::new();
+
+        let body = match body {
+            None => Body::None,
+            Some(body) => {
+                if let Ok(bytes) = body.extract::<Bound<'_, PyBytes>>() {
+                    Body::Bytes(bytes)
+                } else if body.is_instance(GENERATOR_TYPE.import(
+                    body.py(),
+                    "types",
+                    "GeneratorType",
+                )?)? {
+                    // Only generators are sent as chunks. Other iterables, such
+                    // as file objects, still go through the JSON path.
+                    Body::Chunks(body.try_iter()?)
+                } else {
+                    Body::Object(body.clone())
+                }
+            }
+        };
 
         let mut header_fields = Vec::new();
         if let Some(headers) = headers {
@@ -77,6 +95,16 @@ pub mod http_module {
         let body = match &body {
             Body::None => None,
             Body::Bytes(b) => Some(b.as_bytes().to_vec()),
+            Body::Chunks(chunks) => {
+                // Copy each chunk straight into the request buffer. This saves
+                // joining the body into one Python bytes object first; the
+                // request itself still holds the whole body.
+                let mut bytes = Vec::new();
+                for chunk in chunks.clone() {
+                    bytes.extend_from_slice(chunk?.extract::<Bound<'_, PyBytes>>()?.as_bytes());
+                }
+                Some(bytes)
+            }
             Body::Object(b) => {
                 let mut bytes = Vec::new();
                 python_to_json_writer(b.clone(), &mut bytes)
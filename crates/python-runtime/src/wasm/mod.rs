@@ -40,17 +40,14 @@ pub mod sys_module {
     }
     create_future!(PyFutureHostcall, cbor_convert -> PyResult<Bound<'_, PyAny>>);
 
-    fn item_pollable<'py>(item: &Bound<'py, PyAny>) -> Option<PyRef<'py, PyPollable>> {
-        item.get_item(0)
-            .ok()?
-            .extract::<PyRef<'_, PyPollable>>()
-            .ok()
-    }
-
     fn ready_set(pollables: &Bound<'_, PyList>) -> Vec<u8> {
         pollables
             .iter()
-            .map(|item| item_pollable(&item).is_none_or(|pollable| pollable.is_ready()))
+            .map(|item| {
+                item.extract::<PyRef<'_, PyPollable>>()
+                    .ok()
+                    .is_none_or(|pollable| pollable.is_ready())
+            })
             .map(u8::from)
             .collect::<Vec<_>>()
     }
@@ -3,20 +3,24 @@
 from __future__ import annotations
 
 import asyncio
+import contextlib
+from collections import deque
 from collections.abc import AsyncIterable, Awaitable, Callable
+from concurrent.futures import ThreadPoolExecutor
 from dataclasses import dataclass, field
-from itertools import starmap
-from json import loads
-from os import PathLike, fspath
-from typing import TYPE_CHECKING, Literal, TypeAlias, cast
+from functools import partial
+from itertools import islice, starmap
+from os import PathLike, environ, fspath
+from threading import Lock, Thread, get_ident
+from typing import TYPE_CHECKING, Literal, TypeAlias, TypeVar, cast
 from typing_extensions import Self, TypedDict, Unpack
 
 import httpx
 
-from isola._isola import _ContextCore, _StreamCore
+from isola._isola import StreamFullError, _ContextCore, _StreamCore
 
 if TYPE_CHECKING:
-    from collections.abc import AsyncIterator, Iterable, Sequence
+    from collections.abc import AsyncGenerator, AsyncIterator, Iterable, Sequence
 
     from isola._isola import _RunResultCore, _SandboxCore
 
@@ -29,6 +33,8 @@ HttpBody = BytesLike | AsyncIterable[BytesLike] | None
 HostcallHandler = Callable[[JsonValue], Awaitable[object]]
 Hostcalls = dict[str, HostcallHandler]
 
+_T = TypeVar("_T")
+
 
 @dataclass(frozen=True, slots=True)
 class ResultEvent:
@@ -61,6 +67,17 @@ class LogEvent:
 
 
 Event = ResultEvent | EndEvent | StdoutEvent | StderrEvent | ErrorEvent | LogEvent
+_EVENT_TYPES = cast(
+    "dict[str, Callable[[object], Event]]",
+    {
+        "result": ResultEvent,
+        "end": EndEvent,
+        "stdout": StdoutEvent,
+        "stderr": StderrEvent,
+        "error": ErrorEvent,
+        "log": LogEvent,
+    },
+)
 
 
 @dataclass(frozen=True, slots=True)
@@ -81,30 +98,132 @@ class HttpResponse:
 HttpHandler: TypeAlias = Callable[[HttpRequest], Awaitable[object]]
 HttpHandlerConfig: TypeAlias = HttpHandler | Literal[True] | None
 _SANDBOX_CONFIG_KEYS = frozenset({"max_memory", "mounts", "env", "http", "hostcalls"})
+_DEFAULT_STREAM_CAPACITY = 65536
+_PUSH_BATCH_SIZE = 64
+_SMALL_HTTP_BODY_LIMIT = 64 * 1024
+_PENDING_CLOSES: set[asyncio.Task[None]] = set()
+
+
+_EXECUTOR: ThreadPoolExecutor | None = None
+_EXECUTOR_LOCK = Lock()
 
 
-async def _default_httpx_handler(request: HttpRequest) -> HttpResponse:
-    client = httpx.AsyncClient()
+def _executor_size() -> int:
+    value = environ.get("ISOLA_THREADS", "16")
     try:
+        size = int(value)
+    except ValueError:
+        size = 0
+    if size < 1:
+        msg = f"ISOLA_THREADS must be a positive integer, got {value!r}"
+        raise ValueError(msg)
+    return size
+
+
+def _isola_executor() -> ThreadPoolExecutor:
+    # Blocking SDK work gets its own pool so it neither starves nor is starved by
+    # user code sharing the loop's default executor.
+    global _EXECUTOR  # ruff:ignore[global-statement]
+    with _EXECUTOR_LOCK:
+        if _EXECUTOR is None:
+            _EXECUTOR = ThreadPoolExecutor(
+                max_workers=_executor_size(), thread_name_prefix="isola-io"
+            )
+        return _EXECUTOR
+
+
+async def _run_in_thread(func: Callable[[], _T]) -> _T:
+    return await asyncio.get_running_loop().run_in_executor(_isola_executor(), func)
+
+
+async def _run_in_own_thread(func: Callable[[], _T]) -> _T:
+    # For work that may park for as long as a consumer stalls; it must not hold
+    # a slot in the shared pool.
+    loop = asyncio.get_running_loop()
+    future: asyncio.Future[_T] = loop.create_future()
+
+    def _settle(result: _T | None, exc: BaseException | None) -> None:
+        if future.done():
+            return
+        if exc is not None:
+            future.set_exception(exc)
+        else:
+            future.set_result(cast("_T", result))
+
+    def _target() -> None:
+        try:
+            result = func()
+        except BaseException as exc:  # ruff:ignore[blind-except]
+            settle = partial(_settle, None, exc)
+        else:
+            settle = partial(_settle, result, None)
+        with contextlib.suppress(RuntimeError):
+            loop.call_soon_threadsafe(settle)
+
+    Thread(target=_target, name="isola-stream", daemon=True).start()
+    return await future
+
+
+class _HttpxHandler:
+    """Default ``http=True`` handler; one connection pool per sandbox."""
+
+    __slots__ = ("_client",)
+
+    def __init__(self) -> None:
+        self._client: httpx.AsyncClient | None = None
+
+    async def __call__(self, request: HttpRequest) -> HttpResponse:
+        client = self._client
+        if client is None:
+            client = self._client = httpx.AsyncClient()
         outbound_request = client.build_request(
             request.method, request.url, headers=request.headers, content=request.body
         )
         response = await client.send(outbound_request, stream=True)
-    except Exception:
-        await client.aclose()
-        raise
+        headers = dict(response.headers.items())
+
+        content_length = response.headers.get("content-length")
+        if (
+            content_length is not None
+            and content_length.isdigit()
+            and int(content_length) <= _SMALL_HTTP_BODY_LIMIT
+        ):
+            # Small bodies are cheaper to hand over in one piece than to stream.
+            try:
+                body = await response.aread()
+            finally:
+                await response.aclose()
+            return HttpResponse(status=response.status_code, headers=headers, body=body)
 
-    async def _stream_body() -> AsyncIterable[bytes]:
-        try:
-            async for chunk in response.aiter_bytes():
-                yield chunk
-        finally:
-            await response.aclose()
+        async def _stream_body() -> AsyncIterable[bytes]:
+            try:
+                async for chunk in response.aiter_bytes():
+                    yield chunk
+            finally:
+                await response.aclose()
+
+        return HttpResponse(
+            status=response.status_code, headers=headers, body=_stream_body()
+        )
+
+    async def aclose(self) -> None:
+        client = self._client
+        self._client = None
+        if client is not None:
             await client.aclose()
 
-    return HttpResponse(
-        status=response.status_code, headers=dict(response.headers), body=_stream_body()
-    )
+    def close_soon(self) -> None:
+        client = self._client
+        self._client = None
+        if client is None:
+            return
+        try:
+            loop = asyncio.get_running_loop()
+        except RuntimeError:
+            return
+        task = loop.create_task(client.aclose())
+        _PENDING_CLOSES.add(task)
+        task.add_done_callback(_PENDING_CLOSES.discard)
 
 
 @dataclass(frozen=True, slots=True)
@@ -152,9 +271,12 @@ class _StreamArgState:
     core: _StreamCore
     source: AsyncIterable[object] | None
     producer_task: asyncio.Task[None] | None
+    blocking_source: Iterable[object] | None = None
 
 
 class StreamArg:
+    __slots__ = ("_name", "_state")
+
     def __init__(
         self,
         core: _StreamCore,
@@ -180,22 +302,51 @@ class StreamArg:
         return self._state.producer_task
 
     def start_producer(self) -> asyncio.Task[None] | None:
-        if self._state.producer_task is not None or self._state.source is None:
+        if self._state.producer_task is not None:
             return self._state.producer_task
+        blocking_source = self._state.blocking_source
+        if blocking_source is not None:
+            self._state.blocking_source = None
+            return self._start_blocking_producer(blocking_source)
+        if self._state.source is None:
+            return None
 
         source = self._state.source
         self._state.source = None
 
         async def _produce() -> None:
+            core = self._state.core
+            push = core.push
+            push_async = core.push_async
             try:
                 async for item in source:
-                    await self._state.core.push_async(item)
+                    # Only suspend when the stream applies backpressure.
+                    try:
+                        push(item)
+                    except StreamFullError:
+                        await push_async(item)
             finally:
-                self._state.core.end()
+                core.end()
 
         self._state.producer_task = asyncio.create_task(_produce())
         return self._state.producer_task
 
+    def _start_blocking_producer(self, values: Iterable[object]) -> asyncio.Task[None]:
+        core = self._state.core
+
+        def _produce() -> None:
+            push_many = core.push_many
+            # Batches cross into the core once and are sent without the GIL.
+            try:
+                iterator = iter(values)
+                while batch := list(islice(iterator, _PUSH_BATCH_SIZE)):
+                    push_many(batch)
+            finally:
+                core.end()
+
+        self._state.producer_task = asyncio.create_task(_run_in_own_thread(_produce))
+        return self._state.producer_task
+
     def _with_name(self, name: str) -> StreamArg:
         return StreamArg(self._state.core, name=name, _state=self._state)
 
@@ -205,31 +356,48 @@ class StreamArg:
         values: AsyncIterable[object],
         *,
         name: str | None = None,
-        capacity: int = 1024,
+        capacity: int | None = _DEFAULT_STREAM_CAPACITY,
     ) -> StreamArg:
+        """Stream the items of an async iterable into a sandbox call.
+
+        Returns:
+            A stream argument that buffers up to ``capacity`` items ahead of
+            the guest; ``capacity=None`` leaves the buffer unbounded.
+
+        """
         core = _StreamCore(capacity)
         return cls(core, name=name, source=values)
 
     @classmethod
     def from_iterable(
-        cls, values: Iterable[object], *, name: str | None = None, capacity: int = 1024
+        cls,
+        values: Iterable[object],
+        *,
+        name: str | None = None,
+        capacity: int | None = _DEFAULT_STREAM_CAPACITY,
     ) -> StreamArg:
+        """Stream the items of an iterable into a sandbox call.
+
+        Returns:
+            A stream argument that buffers up to ``capacity`` items ahead of
+            the guest; ``capacity=None`` leaves the buffer unbounded.
+
+        """
         try:
             asyncio.get_running_loop()
         except RuntimeError:
             buffered = list(values)
-            core = _StreamCore(max(capacity, len(buffered), 1))
+            # Everything is pushed up front, so the buffer only needs to fit it.
+            core = _StreamCore(len(buffered) or 1)
             for item in buffered:
                 core.push(item)
             core.end()
             return cls(core, name=name)
 
-        async def _iterate() -> AsyncIterable[object]:
-            await asyncio.sleep(0)
-            for item in values:
-                yield item
-
-        return cls.from_async_iterable(_iterate(), name=name, capacity=capacity)
+        # Iterate on a worker thread so large iterables do not stall the loop.
+        core = _StreamCore(capacity)
+        state = _StreamArgState(core, None, None, blocking_source=values)
+        return cls(core, name=name, _state=state)
 
 
 RunArg = Arg | StreamArg | JsonValue
@@ -288,7 +456,7 @@ def _resolve_http_handler(handler: object) -> HttpHandler | None:
     if handler is None:
         return None
     if handler is True:
-        return _default_httpx_handler
+        return _HttpxHandler()
     if isinstance(handler, bool):
         msg = "http must be an async callable, True, or None"
         raise TypeError(msg)
@@ -298,6 +466,24 @@ def _resolve_http_handler(handler: object) -> HttpHandler | None:
     return cast("HttpHandler", handler)
 
 
+def _unchanged(value: object) -> object:
+    return value
+
+
+# (option, normalizer) pairs applied when building configure patches.
+_PatchFields: TypeAlias = tuple[tuple[str, Callable[[object], object]], ...]
+_TEMPLATE_PATCH_FIELDS: _PatchFields = (
+    ("cache_dir", partial(_normalize_optional_path, key="cache_dir")),
+    ("runtime_lib_dir", partial(_normalize_optional_path, key="runtime_lib_dir")),
+    ("mounts", _normalize_mounts),
+)
+_SANDBOX_PATCH_FIELDS: _PatchFields = (
+    ("max_memory", _unchanged),
+    ("mounts", _normalize_mounts),
+    ("env", _unchanged),
+)
+
+
 class SandboxContext:
     def __init__(self) -> None:
         self._core = _ContextCore()
@@ -334,16 +520,9 @@ class SandboxContext:
             )
 
             patch["cache_dir"] = str(_cache_base() / "isola" / "cache")
-        if "cache_dir" in patch:
-            patch["cache_dir"] = _normalize_optional_path(
-                patch["cache_dir"], key="cache_dir"
-            )
-        if "runtime_lib_dir" in patch:
-            patch["runtime_lib_dir"] = _normalize_optional_path(
-                patch["runtime_lib_dir"], key="runtime_lib_dir"
-            )
-        if "mounts" in patch:
-            patch["mounts"] = _normalize_mounts(patch["mounts"])
+        for key, normalize in _TEMPLATE_PATCH_FIELDS:
+            if key in patch:
+                patch[key] = normalize(patch[key])
         _configure_core(self._core, patch)
         normalized_runtime_path = _normalize_path(
             actual_runtime_path, key="runtime_path"
@@ -388,13 +567,12 @@ class SandboxTemplate:
         core = await self._core.instantiate()
         sandbox = Sandbox(core)
 
-        patch: dict[str, object] = {}
-        if "max_memory" in kwargs:
-            patch["max_memory"] = kwargs["max_memory"]
-        if "mounts" in kwargs:
-            patch["mounts"] = _normalize_mounts(kwargs["mounts"])
-        if "env" in kwargs:
-            patch["env"] = kwargs["env"]
+        options = cast("dict[str, object]", kwargs)
+        patch = {
+            key: normalize(options[key])
+            for key, normalize in _SANDBOX_PATCH_FIELDS
+            if key in options
+        }
         _configure_core(sandbox._core, patch)  # ruff:ignore[private-member-access]
 
         hostcalls = kwargs.get("hostcalls")
@@ -445,6 +623,7 @@ class Sandbox:
             ]
             | None
         ) = None
+        self._owned_http_handler: _HttpxHandler | None = None
 
     def _refresh_core_callback(self) -> None:
         if not self._stream_dispatches:
@@ -454,9 +633,11 @@ class Sandbox:
             self._core.set_callback(next(iter(self._stream_dispatches.values())))
             return
 
+        # Listener changes always go through here, so snapshot them once instead
+        # of per event.
+        stream_dispatches = tuple(self._stream_dispatches.values())
+
         def _dispatch(kind: str, data: object) -> None:
-            # Stream listeners can change while events are emitted.
-            stream_dispatches = tuple(self._stream_dispatches.values())
             for stream_dispatch in stream_dispatches:
                 stream_dispatch(kind, data)
 
@@ -493,6 +674,9 @@ class Sandbox:
     def _set_http_handler(
         self, handler: Callable[[HttpRequest], Awaitable[object]] | None
     ) -> None:
+        self._owned_http_handler = (
+            handler if isinstance(handler, _HttpxHandler) else None
+        )
         if handler is None:
             self._http_handler_dispatch = None
             self._core.set_http_handler(None, None)
@@ -525,7 +709,7 @@ class Sandbox:
                 raise TypeError(msg)
             headers = cast("dict[str, str]", raw_headers)
             body_mode, body_payload = _normalize_http_response_body(response.body)
-            return (status, dict(headers), body_mode, body_payload)
+            return (status, headers, body_mode, body_payload)
 
         self._http_handler_dispatch = _dispatch
         self._core.set_http_handler(_dispatch, loop)
@@ -538,19 +722,21 @@ class Sandbox:
     ) -> JsonValue | None:
         final_args = _merge_run_args(args, kwargs)
         result = await self._run_operation(name, final_args)
-        if result.final_json is None:
-            return None
-        return cast("JsonValue", loads(result.final_json))
+        return cast("JsonValue | None", result.final_value)
 
     async def _run_operation(
         self, name: str, args: Sequence[RunArg] | None = None
     ) -> _RunResultCore:
         encoded_args, producers = _encode_args(args)
-        operation = self._core.run(name, encoded_args)
 
         try:
-            result = await operation
+            result = await self._core.run(name, encoded_args)
         except BaseException:
+            # The core may never have taken the receivers; closing the streams
+            # wakes producer threads parked on a full stream.
+            for _, _, payload in encoded_args:
+                if isinstance(payload, _StreamCore):
+                    payload.close()
             for producer in producers:
                 producer.cancel()
             if producers:
@@ -564,59 +750,58 @@ class Sandbox:
     async def run_stream(
         self, name: str, /, *args: RunArg, **kwargs: RunArg
     ) -> AsyncIterator[Event]:
+        batches = self.run_stream_batched(name, *args, **kwargs)
+        try:
+            async for batch in batches:
+                for event in batch:
+                    yield event
+        finally:
+            await batches.aclose()
+
+    async def run_stream_batched(
+        self, name: str, /, *args: RunArg, **kwargs: RunArg
+    ) -> AsyncGenerator[list[Event], None]:
         final_args = _merge_run_args(args, kwargs)
-        completion = object()
-        queue: asyncio.Queue[object] = asyncio.Queue()
+        # Dispatches may arrive on runtime threads: they append under the lock and
+        # schedule at most one wakeup per burst instead of one per event.
+        events: deque[Event] = deque()
+        events_lock = Lock()
+        has_items = asyncio.Event()
         loop = asyncio.get_running_loop()
-        pending_dispatches = 0
+        loop_thread = get_ident()
+        wakeup_scheduled = False
         operation_finished = False
-        completion_enqueued = False
+        completed = False
 
         def _finish_if_drained() -> None:
-            nonlocal completion_enqueued
-            if (
-                operation_finished
-                and pending_dispatches == 0
-                and not completion_enqueued
-            ):
-                completion_enqueued = True
-                queue.put_nowait(completion)
-
-        def _enqueue(event: Event) -> None:
-            nonlocal pending_dispatches
-            queue.put_nowait(event)
-            pending_dispatches -= 1
+            nonlocal completed
+            if operation_finished and not wakeup_scheduled and not completed:
+                completed = True
+                has_items.set()
+
+        def _wakeup() -> None:
+            nonlocal wakeup_scheduled
+            with events_lock:
+                wakeup_scheduled = False
+            has_items.set()
             _finish_if_drained()
 
         def _dispatch(kind: str, data: object) -> None:
-            nonlocal pending_dispatches
-            event: Event
-            if kind == "result":
-                if data is None:
-                    return
-                event = ResultEvent(data=cast("JsonValue", data))
-            elif kind == "end":
-                event = EndEvent(data=cast("JsonValue | None", data))
-            elif kind == "stdout":
-                if data is None:
-                    return
-                event = StdoutEvent(data=cast("str", data))
-            elif kind == "stderr":
-                if data is None:
-                    return
-                event = StderrEvent(data=cast("str", data))
-            elif kind == "error":
-                if data is None:
-                    return
-                event = ErrorEvent(data=cast("str", data))
-            elif kind == "log":
-                if data is None:
+            nonlocal wakeup_scheduled
+            event_type = _EVENT_TYPES.get(kind)
+            if event_type is None or (data is None and kind != "end"):
+                return
+            event = event_type(data)
+            with events_lock:
+                events.append(event)
+                if wakeup_scheduled:
                     return
-                event = LogEvent(data=cast("str", data))
+                wakeup_scheduled = True
+            if get_ident() == loop_thread:
+                # Same ordering as call_soon_threadsafe without the self-pipe wakeup.
+                loop.call_soon(_wakeup)
             else:
-                return
-            pending_dispatches += 1
-            loop.call_soon_threadsafe(_enqueue, event)
+                loop.call_soon_threadsafe(_wakeup)
 
         stream_dispatch_id = self._next_stream_dispatch_id
         self._next_stream_dispatch_id += 1
@@ -633,13 +818,24 @@ class Sandbox:
 
         run_task = asyncio.create_task(_run_and_finish())
 
+        # Bound once: the drain loop runs per wakeup and these are closure cells.
+        clear_events = events.clear
+        clear_has_items = has_items.clear
+        wait_for_items = has_items.wait
+
         try:
             while True:
-                event = await queue.get()
-                if event is completion:
+                if events:
+                    with events_lock:
+                        batch = list(events)
+                        clear_events()
+                    yield batch
+                    continue
+                if completed:
                     await run_task
                     break
-                yield cast("Event", event)
+                clear_has_items()
+                await wait_for_items()
         finally:
             self._stream_dispatches.pop(stream_dispatch_id, None)
             self._refresh_core_callback()
@@ -659,38 +855,75 @@ class Sandbox:
         self._hostcall_handler_dispatch = None
         self._http_handler_dispatch = None
         self._core.close()
+        owned_http_handler = self._owned_http_handler
+        self._owned_http_handler = None
+        if owned_http_handler is not None:
+            owned_http_handler.close_soon()
 
     async def aclose(self) -> None:
         self._stream_dispatches.clear()
         self._hostcall_handler_dispatch = None
         self._http_handler_dispatch = None
         self._core.close()
+        owned_http_handler = self._owned_http_handler
+        self._owned_http_handler = None
+        if owned_http_handler is not None:
+            await owned_http_handler.aclose()
+
+
+_EncodedArg: TypeAlias = tuple[str, str | None, object]
+
+
+def _encode_json_arg(arg: object) -> _EncodedArg:
+    return ("json", None, arg)
+
+
+def _encode_named_arg(arg: object) -> _EncodedArg:
+    named = cast("Arg", arg)
+    return ("json", named.name, named.value)
+
+
+def _encode_stream_arg(arg: object) -> _EncodedArg:
+    stream = cast("StreamArg", arg)
+    return ("stream", stream.name, stream.stream_core)
+
+
+_ARG_ENCODERS: dict[type, Callable[[object], _EncodedArg]] = {
+    Arg: _encode_named_arg,
+    StreamArg: _encode_stream_arg,
+    **dict.fromkeys((bool, int, float, str, list, dict, type(None)), _encode_json_arg),
+}
+
+
+def _arg_encoder(arg: object) -> Callable[[object], _EncodedArg]:
+    # Slow path for subclasses of the types in _ARG_ENCODERS.
+    if isinstance(arg, Arg):
+        return _encode_named_arg
+    if isinstance(arg, StreamArg):
+        return _encode_stream_arg
+    if not isinstance(arg, (bool, int, float, str, list, dict)):
+        msg = f"invalid run argument type: {type(arg)!r}"
+        raise TypeError(msg)
+    return _encode_json_arg
 
 
 def _encode_args(
     args: Sequence[object] | None,
-) -> tuple[list[tuple[str, str | None, object]], list[asyncio.Task[None]]]:
+) -> tuple[list[_EncodedArg], list[asyncio.Task[None]]]:
     if args is None:
         return [], []
 
-    encoded: list[tuple[str, str | None, object]] = []
+    encoded: list[_EncodedArg] = []
     producers: list[asyncio.Task[None]] = []
     stream_args: list[StreamArg] = []
 
+    lookup_encoder = _ARG_ENCODERS.get
+    append_encoded = encoded.append
     for arg in args:
-        if isinstance(arg, Arg):
-            encoded.append(("json", arg.name, arg.value))
-            continue
-
-        if isinstance(arg, StreamArg):
-            encoded.append(("stream", arg.name, arg.stream_core))
-            stream_args.append(arg)
-            continue
-
-        if not isinstance(arg, (bool, int, float, str, list, dict)) and arg is not None:
-            msg = f"invalid run argument type: {type(arg)!r}"
-            raise TypeError(msg)
-        encoded.append(("json", None, cast("object", arg)))
+        encoder = lookup_encoder(type(arg)) or _arg_encoder(arg)
+        if encoder is _encode_stream_arg:
+            stream_args.append(cast("StreamArg", arg))
+        append_encoded(encoder(arg))
 
     for stream_arg in stream_args:
         producer = stream_arg.start_producer()
@@ -736,30 +969,20 @@ def _normalize_http_response_body(body: object) -> tuple[str, object]:
     if body is None:
         return ("none", None)
 
-    if isinstance(body, bytes):
+    # The native core copies bytes-like payloads itself, so pass them through.
+    if isinstance(body, (bytes, bytearray, memoryview)):
         return ("bytes", body)
-    if isinstance(body, bytearray):
-        return ("bytes", bytes(body))
-    if isinstance(body, memoryview):
-        return ("bytes", body.tobytes())
 
     if not isinstance(body, AsyncIterable):
         msg = "http response body must be bytes, AsyncIterable[bytes], or None"
         raise TypeError(msg)
 
-    async def _stream_body(source: AsyncIterable[object]) -> AsyncIterable[bytes]:
+    async def _stream_body(source: AsyncIterable[object]) -> AsyncIterable[BytesLike]:
         async for chunk in source:
-            if isinstance(chunk, bytes):
-                yield chunk
-                continue
-            if isinstance(chunk, bytearray):
-                yield bytes(chunk)
-                continue
-            if isinstance(chunk, memoryview):
-                yield chunk.tobytes()
-                continue
-            msg = "http response stream chunks must be bytes-like"
-            raise TypeError(msg)
+            if not isinstance(chunk, (bytes, bytearray, memoryview)):
+                msg = "http response stream chunks must be bytes-like"
+                raise TypeError(msg)
+            yield chunk
 
     source = cast("AsyncIterable[object]", body)
     return ("stream", _stream_body(source))
@@ -1,5 +1,5 @@
 from asyncio import AbstractEventLoop
-from collections.abc import Awaitable, Callable
+from collections.abc import Awaitable, Callable, Iterable
 
 class IsolaError(Exception): ...
 class InvalidArgumentError(IsolaError): ...
@@ -13,6 +13,8 @@ class _RunResultCore:
     @property
     def final_json(self) -> str | None: ...
     @property
+    def final_value(self) -> object: ...
+    @property
     def stdout(self) -> list[str]: ...
     @property
     def stderr(self) -> list[str]: ...
@@ -22,10 +24,12 @@ class _RunResultCore:
     def errors(self) -> list[str]: ...
 
 class _StreamCore:
-    def __init__(self, capacity: int = 1024) -> None: ...
+    def __init__(self, capacity: int | None = 65536) -> None: ...
     def push(self, value: object, blocking: bool = False) -> None: ...
+    def push_many(self, values: Iterable[object]) -> None: ...
     def push_async(self, value: object) -> Awaitable[None]: ...
     def end(self) -> None: ...
+    def close(self) -> None: ...
 
 class _SandboxCore:
     def configure(self, config: object) -> None: ...
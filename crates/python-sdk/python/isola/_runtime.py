@@ -1,21 +1,26 @@
 from __future__ import annotations
 
 import asyncio
-import copy
+import contextlib
 import errno
 import hashlib
 import io
 import os
-import shutil
-import tarfile
-import tempfile
+from functools import partial
 from importlib.metadata import version as _pkg_version
 from pathlib import Path, PurePosixPath
-from typing import Literal
+from queue import Empty, Full, Queue
+from typing import IO, TYPE_CHECKING, Literal
+from typing_extensions import override
 
 import httpx
 
-from isola._core import TemplateConfig
+from isola._core import TemplateConfig, _run_in_own_thread, _run_in_thread
+
+if TYPE_CHECKING:
+    import tarfile
+    from collections.abc import Awaitable, Callable
+    from typing_extensions import Buffer
 
 RuntimeName = Literal["python", "js"]
 
@@ -25,6 +30,7 @@ _TARBALL_NAMES: dict[str, str] = {
     "js": "isola-js-runtime.tar.gz",
 }
 _RELEASE_API = "https://api.github.com/repos/brian14708/isola/releases/tags/{version}"
+_READ_AHEAD_CHUNKS = 16
 
 
 def _version_tag(ver: str) -> str:
@@ -59,8 +65,7 @@ async def resolve_runtime(
     # Download and extract.
     tarball_name = _TARBALL_NAMES[runtime]
     expected_digest = await _fetch_expected_digest(version, tarball_name)
-    tarball_bytes = await _download_tarball(version, tarball_name, expected_digest)
-    await _extract_tarball(tarball_bytes, cache_dir)
+    await _download_and_extract(version, tarball_name, expected_digest, cache_dir)
 
     if not check_path.is_file():
         msg = f"downloaded runtime is missing {_BUNDLE_FILES[runtime]!r}"
@@ -96,15 +101,96 @@ async def _fetch_expected_digest(version: str, tarball_name: str) -> str:
     raise RuntimeError(msg)
 
 
+# Blocking file object for the extraction thread, fed from the event loop.
+class _ChunkReader(io.RawIOBase):
+    def __init__(self) -> None:
+        # Bounded so a slow extractor holds back the download instead of
+        # buffering the whole bundle in memory.
+        self._chunks: Queue[bytes | None] = Queue(maxsize=_READ_AHEAD_CHUNKS)
+        self._pending = memoryview(b"")
+        self._eof = False
+        self._abandoned = False
+
+    async def feed(self, chunk: bytes) -> None:
+        await self._put(chunk)
+
+    async def feed_eof(self) -> None:
+        await self._put(None)
+
+    async def _put(self, chunk: bytes | None) -> None:
+        if self._abandoned:
+            return
+        try:
+            self._chunks.put_nowait(chunk)
+        except Full:
+            await _run_in_own_thread(partial(self._chunks.put, chunk))
+
+    def abandon(self) -> None:
+        # Called by the reader when it stops early. Queued chunks are dropped so
+        # a blocked feed() can finish, and later chunks are ignored.
+        self._abandoned = True
+        with contextlib.suppress(Empty):
+            while True:
+                self._chunks.get_nowait()
+
+    @override
+    def readable(self) -> bool:
+        return True
+
+    @override
+    def readinto(self, buffer: Buffer) -> int:
+        while not self._pending:
+            if self._eof:
+                return 0
+            chunk = self._chunks.get()
+            if chunk is None:
+                self._eof = True
+                return 0
+            self._pending = memoryview(chunk)
+        with memoryview(buffer) as view:
+            size = min(len(view), len(self._pending))
+            view[:size] = self._pending[:size]
+        self._pending = self._pending[size:]
+        return size
+
+
+async def _download_and_extract(
+    version: str, tarball_name: str, expected_digest: str, dest: Path
+) -> None:
+    # Unpack while the bundle is still downloading. Nothing is moved into the
+    # cache until the digest of the complete download has been checked.
+    reader = _ChunkReader()
+
+    def _unpack() -> str:
+        try:
+            return _unpack_tarball(reader, dest)
+        finally:
+            reader.abandon()
+
+    unpack = asyncio.create_task(_run_in_thread(_unpack))
+    try:
+        await _download_tarball(version, tarball_name, expected_digest, reader.feed)
+    except BaseException:
+        await reader.feed_eof()
+        with contextlib.suppress(Exception):
+            await _run_in_thread(partial(_discard_unpacked, await unpack))
+        raise
+    await reader.feed_eof()
+    tmp_dir = await unpack
+    await _run_in_thread(partial(_install_unpacked, tmp_dir, dest))
+
+
 async def _download_tarball(
-    version: str, tarball_name: str, expected_digest: str
-) -> bytes:
+    version: str,
+    tarball_name: str,
+    expected_digest: str,
+    write: Callable[[bytes], Awaitable[object]],
+) -> None:
     download_url = (
         "https://github.com/brian14708/isola"
         f"/releases/download/{_version_tag(version)}/{tarball_name}"
     )
     sha = hashlib.sha256()
-    chunks: list[bytes] = []
 
     async with (
         httpx.AsyncClient(follow_redirects=True) as client,
@@ -113,7 +199,7 @@ async def _download_tarball(
         resp.raise_for_status()
         async for chunk in resp.aiter_bytes():
             sha.update(chunk)
-            chunks.append(chunk)
+            await write(chunk)
 
     actual = f"sha256:{sha.hexdigest()}"
     if actual != expected_digest:
@@ -123,37 +209,54 @@ async def _download_tarball(
         )
         raise RuntimeError(msg)
 
-    return b"".join(chunks)
-
-
-async def _extract_tarball(data: bytes, dest: Path) -> None:
-    def _do_extract() -> None:
-        dest.parent.mkdir(parents=True, exist_ok=True)
-        tmp_dir = tempfile.mkdtemp(dir=dest.parent, prefix=f".{dest.name}-")
-        try:
-            with tarfile.open(fileobj=io.BytesIO(data), mode="r:gz") as tf:
-                symlink_paths: set[PurePosixPath] = set()
-                for member in tf.getmembers():
-                    stripped_name = _strip_first_path_component(member.name)
-                    if stripped_name is None:
-                        continue
-
-                    _validate_tar_member(member, stripped_name, symlink_paths)
 
-                    extracted_member = copy.copy(member)
-                    extracted_member.name = stripped_name
+def _unpack_tarball(fileobj: IO[bytes] | io.RawIOBase, dest: Path) -> str:
+    # Archive handling is only needed on a cache miss, so keep it off the
+    # import path.
+    import copy  # ruff:ignore[import-outside-top-level]
+    import tarfile  # ruff:ignore[import-outside-top-level]
+    import tempfile  # ruff:ignore[import-outside-top-level]
+
+    # Extraction filters landed in 3.12 and were backported to 3.10.12/3.11.4.
+    has_extraction_filters = hasattr(tarfile, "data_filter")
+    dest.parent.mkdir(parents=True, exist_ok=True)
+    tmp_dir = tempfile.mkdtemp(dir=dest.parent, prefix=f".{dest.name}-")
+    try:
+        # Stream mode validates and extracts each member in a single pass.
+        with tarfile.open(fileobj=fileobj, mode="r|gz") as tf:
+            symlink_paths: set[PurePosixPath] = set()
+            for member in tf:
+                stripped_name = _strip_first_path_component(member.name)
+                if stripped_name is None:
+                    continue
+
+                _validate_tar_member(member, stripped_name, symlink_paths)
+
+                extracted_member = copy.copy(member)
+                extracted_member.name = stripped_name
+                if has_extraction_filters:
+                    tf.extract(extracted_member, tmp_dir, filter="data")
+                else:
                     tf.extract(extracted_member, tmp_dir)
-            try:
-                Path(tmp_dir).rename(dest)
-            except OSError as exc:
-                if exc.errno not in {errno.EEXIST, errno.ENOTEMPTY}:
-                    raise
-                shutil.rmtree(tmp_dir, ignore_errors=True)
-        except BaseException:
-            shutil.rmtree(tmp_dir, ignore_errors=True)
+    except BaseException:
+        _discard_unpacked(tmp_dir)
+        raise
+    return tmp_dir
+
+
+def _install_unpacked(tmp_dir: str, dest: Path) -> None:
+    try:
+        Path(tmp_dir).rename(dest)
+    except OSError as exc:
+        _discard_unpacked(tmp_dir)
+        if exc.errno not in {errno.EEXIST, errno.ENOTEMPTY}:
             raise
 
-    await asyncio.to_thread(_do_extract)
+
+def _discard_unpacked(tmp_dir: str) -> None:
+    import shutil  # ruff:ignore[import-outside-top-level]
+
+    shutil.rmtree(tmp_dir, ignore_errors=True)
 
 
 def _validate_symlink_target(
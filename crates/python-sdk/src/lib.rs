@@ -22,14 +22,15 @@ use parking_lot::Mutex;
 use pyo3::{
     create_exception,
     exceptions::PyException,
+    intern,
     prelude::*,
-    types::{PyAnyMethods, PyBytes, PyDict, PyModule},
+    types::{PyAnyMethods, PyByteArray, PyBytes, PyDict, PyModule, PyString},
 };
 use pyo3_async_runtimes::TaskLocals;
 
-use crate::serde::{py_to_value, value_to_py};
+use crate::serde::{py_to_value, value_to_json_py, value_to_py};
 
-const DEFAULT_STREAM_CAPACITY: usize = 1024;
+const DEFAULT_STREAM_CAPACITY: usize = 65536;
 const DEFAULT_HTTP_STREAM_CAPACITY: usize = 8;
 
 create_exception!(_isola, IsolaError, PyException);
@@ -481,7 +482,7 @@ impl PyCallback {
     fn emit(&self, event: CallbackEvent, data: Option<&str>) {
         Python::attach(|py| {
             let callback = self.callback.bind(py);
-            if let Err(err) = callback.call1((event.as_str(), data)) {
+            if let Err(err) = callback.call1((event.as_py_str(py), data)) {
                 err.write_unraisable(py, Some(callback));
             }
         });
@@ -500,7 +501,7 @@ impl PyCallback {
                 None => py.None(),
             };
             let callback = self.callback.bind(py);
-            if let Err(err) = callback.call1((event.as_str(), py_data)) {
+            if let Err(err) = callback.call1((event.as_py_str(py), py_data)) {
                 err.write_unraisable(py, Some(callback));
             }
         });
@@ -545,13 +546,16 @@ fn py_bytes_to_rust_bytes(value: &Bound<'_, PyAny>) -> std::result::Result<Bytes
     if let Ok(py_bytes) = value.cast::<PyBytes>() {
         return Ok(Bytes::copy_from_slice(py_bytes.as_bytes()));
     }
+    // Copy a bytearray straight into an owned buffer instead of going through
+    // an intermediate `bytes` object.
+    if let Ok(py_bytearray) = value.cast::<PyByteArray>() {
+        return Ok(Bytes::from(py_bytearray.to_vec()));
+    }
 
-    let py = value.py();
-    let builtins = py
-        .import("builtins")
-        .map_err(|e| py_error_to_box_error("builtins", &e))?;
-    let coerced = builtins
-        .call_method1("bytes", (value,))
+    let coerced = value
+        .py()
+        .get_type::<PyBytes>()
+        .call1((value,))
         .map_err(|e| py_error_to_box_error("body chunk must be bytes-like", &e))?;
     let py_bytes = coerced
         .cast::<PyBytes>()
@@ -559,6 +563,21 @@ fn py_bytes_to_rust_bytes(value: &Bound<'_, PyAny>) -> std::result::Result<Bytes
     Ok(Bytes::copy_from_slice(py_bytes.as_bytes()))
 }
 
+/// Collect response headers from a dict or any mapping exposing `items()`.
+fn response_header_items(headers: &Bound<'_, PyAny>) -> PyResult<Vec<(String, String)>> {
+    if let Ok(dict) = headers.cast::<PyDict>() {
+        return dict
+            .iter()
+            .map(|(name, value)| Ok((name.extract()?, value.extract()?)))
+            .collect();
+    }
+    headers
+        .call_method0("items")?
+        .try_iter()?
+        .map(|item| item?.extract::<(String, String)>())
+        .collect()
+}
+
 async fn await_python_coroutine(
     event_loop: &Py<PyAny>,
     create_coro: impl for<'py> FnOnce(Python<'py>) -> PyResult<Bound<'py, PyAny>> + Send + 'static,
@@ -627,18 +646,14 @@ impl PyHttpHandler {
         Python::attach(|py| {
             let tuple = result
                 .bind(py)
-                .extract::<(u16, Bound<'_, PyDict>, String, Py<PyAny>)>()
+                .extract::<(u16, Bound<'_, PyAny>, String, Py<PyAny>)>()
                 .map_err(|e| py_error_to_box_error("invalid http response payload", &e))?;
-            let (status, headers_dict, body_mode, body_payload) = tuple;
+            let (status, headers, body_mode, body_payload) = tuple;
 
             let mut builder = http::Response::builder().status(status);
-            for (k, v) in headers_dict.iter() {
-                let name = k
-                    .extract::<String>()
-                    .map_err(|e| py_error_to_box_error("response header name must be str", &e))?;
-                let value = v
-                    .extract::<String>()
-                    .map_err(|e| py_error_to_box_error("response header value must be str", &e))?;
+            for (name, value) in response_header_items(&headers)
+                .map_err(|e| py_error_to_box_error("response headers must map str to str", &e))?
+            {
                 builder = builder.header(name, value);
             }
             let response = builder
@@ -780,26 +795,52 @@ enum CallbackEvent {
 }
 
 impl CallbackEvent {
-    const fn as_str(self) -> &'static str {
+    fn as_py_str<'py>(self, py: Python<'py>) -> &'py Bound<'py, PyString> {
         match self {
-            Self::Result => "result",
-            Self::End => "end",
-            Self::Stdout => "stdout",
-            Self::Stderr => "stderr",
-            Self::Error => "error",
-            Self::Log => "log",
+            Self::Result => intern!(py, "result"),
+            Self::End => intern!(py, "end"),
+            Self::Stdout => intern!(py, "stdout"),
+            Self::Stderr => intern!(py, "stderr"),
+            Self::Error => intern!(py, "error"),
+            Self::Log => intern!(py, "log"),
         }
     }
 }
 
+/// Append-only list of strings backed by a single buffer.
+#[derive(Default)]
+struct LineBuffer {
+    text: String,
+    ends: Vec<usize>,
+}
+
+impl LineBuffer {
+    fn push(&mut self, line: &str) {
+        self.text.push_str(line);
+        self.ends.push(self.text.len());
+    }
+
+    fn lines(&self) -> Vec<&str> {
+        let mut start = 0;
+        self.ends
+            .iter()
+            .map(|&end| {
+                let line = &self.text[start..end];
+                start = end;
+                line
+            })
+            .collect()
+    }
+}
+
 #[derive(Default)]
 struct OutputData {
-    result_json: Vec<String>,
-    final_json: Option<String>,
-    stdout: Vec<String>,
-    stderr: Vec<String>,
-    logs: Vec<String>,
-    errors: Vec<String>,
+    results: Vec<Value>,
+    final_value: Option<Value>,
+    stdout: LineBuffer,
+    stderr: LineBuffer,
+    logs: LineBuffer,
+    errors: LineBuffer,
 }
 
 #[derive(Clone)]
@@ -831,15 +872,15 @@ impl OutputCollector {
     }
 
     fn emit_error_message(&self, message: &str) {
-        self.record(|data| data.errors.push(message.to_owned()));
+        self.record(|data| data.errors.push(message));
         self.emit(CallbackEvent::Error, Some(message));
     }
 
     fn into_result(self) -> PyRunResult {
         let data = std::mem::take(&mut *self.data.lock());
         PyRunResult {
-            result_json: data.result_json,
-            final_json: data.final_json,
+            results: data.results,
+            final_value: data.final_value,
             stdout: data.stdout,
             stderr: data.stderr,
             logs: data.logs,
@@ -851,29 +892,26 @@ impl OutputCollector {
 impl OutputCollector {
     fn target(&self) -> OutputTarget {
         let collector = self.clone();
-        OutputTarget::synchronous(move |event| collector.handle_event(event))
+        OutputTarget::synchronous(move |event| {
+            collector.handle_event(event);
+            Ok(())
+        })
     }
 
-    fn handle_event(&self, event: OutputEvent) -> std::result::Result<(), BoxError> {
+    fn handle_event(&self, event: OutputEvent) {
         match event {
             OutputEvent::Item(item) => {
-                let text = item.to_json_str().map_err(|e| -> BoxError {
-                    Box::new(std::io::Error::new(std::io::ErrorKind::InvalidData, e))
-                })?;
-                self.record(|data| data.result_json.push(text));
                 if let Some(callback) = &self.callback {
                     callback.emit_value(CallbackEvent::Result, Some(&item));
                 }
+                self.record(|data| data.results.push(item));
             }
             OutputEvent::Complete(item) => {
                 if let Some(item) = item {
-                    let text = item.to_json_str().map_err(|e| -> BoxError {
-                        Box::new(std::io::Error::new(std::io::ErrorKind::InvalidData, e))
-                    })?;
-                    self.record(|data| data.final_json = Some(text));
                     if let Some(callback) = &self.callback {
                         callback.emit_value(CallbackEvent::End, Some(&item));
                     }
+                    self.record(|data| data.final_value = Some(item));
                 } else {
                     self.emit(CallbackEvent::End, None);
                 }
@@ -886,14 +924,13 @@ impl OutputCollector {
                 };
                 self.emit(callback_event, Some(&message));
                 self.record(|data| match level {
-                    LogLevel::Stdout => data.stdout.push(message),
-                    LogLevel::Stderr => data.stderr.push(message),
-                    _ => data.logs.push(message),
+                    LogLevel::Stdout => data.stdout.push(&message),
+                    LogLevel::Stderr => data.stderr.push(&message),
+                    _ => data.logs.push(&message),
                 });
             }
             _ => {}
         }
-        Ok(())
     }
 }
 
@@ -1337,24 +1374,93 @@ impl PySandbox {
 
 #[pyclass(name = "_RunResultCore")]
 struct PyRunResult {
-    #[pyo3(get)]
-    result_json: Vec<String>,
-    #[pyo3(get)]
-    final_json: Option<String>,
-    #[pyo3(get)]
-    stdout: Vec<String>,
-    #[pyo3(get)]
-    stderr: Vec<String>,
-    #[pyo3(get)]
-    logs: Vec<String>,
-    #[pyo3(get)]
-    errors: Vec<String>,
+    results: Vec<Value>,
+    final_value: Option<Value>,
+    stdout: LineBuffer,
+    stderr: LineBuffer,
+    logs: LineBuffer,
+    errors: LineBuffer,
+}
+
+// Results are converted on access; failures keep the InternalError that
+// run() raised when conversion happened while the call was running.
+fn value_to_json(value: &Value) -> PyResult<String> {
+    value
+        .to_json_str()
+        .map_err(|e| to_py_err(Error::Internal(format!("invalid JSON result: {e}"))))
+}
+
+#[pymethods]
+impl PyRunResult {
+    #[getter]
+    fn result_json(&self) -> PyResult<Vec<String>> {
+        self.results.iter().map(value_to_json).collect()
+    }
+
+    #[getter]
+    fn final_json(&self) -> PyResult<Option<String>> {
+        self.final_value.as_ref().map(value_to_json).transpose()
+    }
+
+    #[getter]
+    fn final_value(&self, py: Python<'_>) -> PyResult<Py<PyAny>> {
+        self.final_value
+            .as_ref()
+            .map_or_else(
+                || Ok(py.None()),
+                |value| {
+                    value_to_json_py(py, value).map_err(|e| {
+                        to_py_err(Error::Internal(format!(
+                            "invalid JSON result: {}",
+                            e.value(py)
+                        )))
+                    })
+                },
+            )
+    }
+
+    #[getter]
+    fn stdout(&self) -> Vec<&str> {
+        self.stdout.lines()
+    }
+
+    #[getter]
+    fn stderr(&self) -> Vec<&str> {
+        self.stderr.lines()
+    }
+
+    #[getter]
+    fn logs(&self) -> Vec<&str> {
+        self.logs.lines()
+    }
+
+    #[getter]
+    fn errors(&self) -> Vec<&str> {
+        self.errors.lines()
+    }
 }
 
 #[pyclass(name = "_StreamCore")]
 struct StreamHandle {
     sender: Mutex<Option<tokio::sync::mpsc::Sender<Value>>>,
     receiver: Mutex<Option<tokio::sync::mpsc::Receiver<Value>>>,
+    closed: tokio::sync::watch::Sender<bool>,
+}
+
+/// Send `value`, waiting for capacity until the stream is closed.
+fn send_until_closed(
+    sender: &tokio::sync::mpsc::Sender<Value>,
+    closed: &mut tokio::sync::watch::Receiver<bool>,
+    value: Value,
+) -> Result<()> {
+    futures::executor::block_on(async {
+        let send = std::pin::pin!(sender.send(value));
+        let cancelled = std::pin::pin!(closed.wait_for(|closed| *closed));
+        match futures::future::select(send, cancelled).await {
+            futures::future::Either::Left((Ok(()), _)) => Ok(()),
+            _ => Err(Error::StreamClosed),
+        }
+    })
 }
 
 impl StreamHandle {
@@ -1393,18 +1499,24 @@ impl StreamHandle {
 #[pymethods]
 impl StreamHandle {
     #[new]
-    #[pyo3(signature = (capacity = DEFAULT_STREAM_CAPACITY))]
-    fn new(capacity: usize) -> PyResult<Self> {
+    #[pyo3(signature = (capacity = Some(DEFAULT_STREAM_CAPACITY)))]
+    fn new(capacity: Option<usize>) -> PyResult<Self> {
+        let capacity = capacity.unwrap_or(tokio::sync::Semaphore::MAX_PERMITS);
         if capacity == 0 {
             return Err(to_py_err(invalid_argument(
                 "stream capacity must be greater than 0",
             )));
         }
 
+        if capacity > tokio::sync::Semaphore::MAX_PERMITS {
+            return Err(to_py_err(invalid_argument("stream capacity is too large")));
+        }
+
         let (sender, receiver) = tokio::sync::mpsc::channel(capacity);
         Ok(Self {
             sender: Mutex::new(Some(sender)),
             receiver: Mutex::new(Some(receiver)),
+            closed: tokio::sync::watch::Sender::new(false),
         })
     }
 
@@ -1414,16 +1526,30 @@ impl StreamHandle {
 
         if blocking {
             let sender = self.sender().map_err(to_py_err)?;
-            let result = py.detach(move || sender.blocking_send(value));
-            match result {
-                Ok(()) => Ok(()),
-                Err(_) => Err(to_py_err(Error::StreamClosed)),
-            }
+            let mut closed = self.closed.subscribe();
+            py.detach(move || send_until_closed(&sender, &mut closed, value))
+                .map_err(to_py_err)
         } else {
             self.try_send(value).map_err(to_py_err)
         }
     }
 
+    /// Convert a batch of values up front, then send them all without the GIL.
+    fn push_many(&self, py: Python<'_>, values: &Bound<'_, PyAny>) -> PyResult<()> {
+        let values = values
+            .try_iter()?
+            .map(|item| py_to_value(&item?).map_err(to_py_err))
+            .collect::<PyResult<Vec<_>>>()?;
+        let sender = self.sender().map_err(to_py_err)?;
+        let mut closed = self.closed.subscribe();
+        py.detach(move || {
+            values
+                .into_iter()
+                .try_for_each(|value| send_until_closed(&sender, &mut closed, value))
+        })
+        .map_err(to_py_err)
+    }
+
     fn push_async<'py>(
         &self,
         py: Python<'py>,
@@ -1444,6 +1570,14 @@ impl StreamHandle {
     fn end(&self) {
         self.close_sender();
     }
+
+    /// Close the stream and wake producers blocked on it, even once a run
+    /// has taken the receiver.
+    fn close(&self) {
+        self.closed.send_replace(true);
+        self.close_sender();
+        self.receiver.lock().take();
+    }
 }
 
 #[derive(Clone)]
@@ -2,8 +2,8 @@ use isola::value::Value;
 use pyo3::{
     Bound, IntoPyObject, PyAny, PyResult, PyTypeInfo, Python,
     types::{
-        PyAnyMethods, PyBytes, PyDict, PyFloat, PyInt, PyList, PyNone, PySet, PyStringMethods,
-        PyTuple, PyTypeMethods,
+        PyAnyMethods, PyBool, PyBoolMethods, PyBytes, PyBytesMethods, PyDict, PyFloat, PyInt,
+        PyList, PyNone, PySet, PyString, PyStringMethods, PyTuple, PyTypeMethods,
     },
 };
 use serde::{
@@ -114,6 +114,8 @@ impl Serialize for PyValue<'_> {
                     ));
                 }
                 let o = &self.0;
+                // Exact builtin types are plain pointer comparisons; try them before
+                // the extraction-based fallbacks, which build a PyErr on every miss.
                 if let Ok(dict) = o.cast_exact::<PyDict>() {
                     let len = dict.len().ok();
                     let mut map = serializer.serialize_map(len)?;
@@ -121,8 +123,6 @@ impl Serialize for PyValue<'_> {
                         map.serialize_entry(&self.child(key), &self.child(value))?;
                     }
                     map.end()
-                } else if let Ok(s) = o.extract::<&[u8]>() {
-                    serializer.serialize_bytes(s)
                 } else if let Ok(list) = o.cast_exact::<PyList>() {
                     let len = list.len().ok();
                     let mut seq = serializer.serialize_seq(len)?;
@@ -130,36 +130,12 @@ impl Serialize for PyValue<'_> {
                         seq.serialize_element(&self.child(elem))?;
                     }
                     seq.end()
-                } else if let Ok(set) = o.cast_exact::<PySet>() {
-                    let len = set.len().ok();
-                    let mut seq = serializer.serialize_seq(len)?;
-                    for elem in set {
-                        seq.serialize_element(&self.child(elem))?;
-                    }
-                    seq.end()
-                } else if let Ok(tuple) = o.cast_exact::<PyTuple>() {
-                    let len = tuple.len().map_err(serde::ser::Error::custom)?;
-                    let mut seq = serializer.serialize_tuple(len)?;
-                    for elem in tuple {
-                        seq.serialize_element(&self.child(elem))?;
-                    }
-                    seq.end()
-                } else if let Ok(s) = o.extract::<&str>() {
-                    serializer.serialize_str(s)
-                } else if let Ok(b) = o.extract::<bool>() {
-                    serializer.serialize_bool(b)
+                } else if let Ok(s) = o.cast_exact::<PyString>() {
+                    serializer.serialize_str(s.to_str().map_err(serde::ser::Error::custom)?)
                 } else if o.is_none() {
                     serializer.serialize_none()
-                } else if PyFloat::is_exact_type_of(o) {
-                    o.extract::<f64>().map_or_else(
-                        |_| {
-                            Err(serde::ser::Error::custom(format!(
-                                "object of type '{}' does not fit into a float",
-                                o.get_type()
-                            )))
-                        },
-                        |f| serializer.serialize_f64(f),
-                    )
+                } else if let Ok(b) = o.cast_exact::<PyBool>() {
+                    serializer.serialize_bool(b.is_true())
                 } else if PyInt::is_exact_type_of(o) {
                     if let Ok(i) = o.extract::<i32>() {
                         serializer.serialize_i32(i)
@@ -176,6 +152,38 @@ impl Serialize for PyValue<'_> {
                             |u| serializer.serialize_u64(u),
                         )
                     }
+                } else if PyFloat::is_exact_type_of(o) {
+                    o.extract::<f64>().map_or_else(
+                        |_| {
+                            Err(serde::ser::Error::custom(format!(
+                                "object of type '{}' does not fit into a float",
+                                o.get_type()
+                            )))
+                        },
+                        |f| serializer.serialize_f64(f),
+                    )
+                } else if let Ok(b) = o.cast_exact::<PyBytes>() {
+                    serializer.serialize_bytes(b.as_bytes())
+                } else if let Ok(s) = o.extract::<&[u8]>() {
+                    serializer.serialize_bytes(s)
+                } else if let Ok(set) = o.cast_exact::<PySet>() {
+                    let len = set.len().ok();
+                    let mut seq = serializer.serialize_seq(len)?;
+                    for elem in set {
+                        seq.serialize_element(&self.child(elem))?;
+                    }
+                    seq.end()
+                } else if let Ok(tuple) = o.cast_exact::<PyTuple>() {
+                    let len = tuple.len().map_err(serde::ser::Error::custom)?;
+                    let mut seq = serializer.serialize_tuple(len)?;
+                    for elem in tuple {
+                        seq.serialize_element(&self.child(elem))?;
+                    }
+                    seq.end()
+                } else if let Ok(s) = o.extract::<&str>() {
+                    serializer.serialize_str(s)
+                } else if let Ok(b) = o.extract::<bool>() {
+                    serializer.serialize_bool(b)
                 } else {
                     Err(serde::ser::Error::custom(format!(
                         "object of type '{}' is not serializable",
@@ -580,7 +588,22 @@ pub fn py_to_value(obj: &Bound<'_, PyAny>) -> Result<Value> {
     Ok(Value::from_cbor(serializer.into_encoder().into_writer()))
 }
 
+fn is_exact_builtin(obj: &Bound<'_, PyAny>) -> bool {
+    obj.is_none()
+        || PyDict::is_exact_type_of(obj)
+        || PyList::is_exact_type_of(obj)
+        || PyString::is_exact_type_of(obj)
+        || PyInt::is_exact_type_of(obj)
+        || PyFloat::is_exact_type_of(obj)
+        || PyBool::is_exact_type_of(obj)
+        || PyBytes::is_exact_type_of(obj)
+        || PyTuple::is_exact_type_of(obj)
+}
+
 fn numpy_to_cbor(obj: &Bound<'_, PyAny>) -> PyResult<Option<Vec<u8>>> {
+    if is_exact_builtin(obj) {
+        return Ok(None);
+    }
     if obj.get_type().module()?.to_str()? != "numpy" || !obj.hasattr("dtype")? {
         return Ok(None);
     }
@@ -624,6 +647,21 @@ fn numpy_to_cbor(obj: &Bound<'_, PyAny>) -> PyResult<Option<Vec<u8>>> {
     Ok(Some(out))
 }
 
+/// Convert an isola `Value` to the Python object its JSON rendering decodes to.
+///
+/// Byte strings and typed arrays become base64 strings, exactly as in
+/// `Value::to_json_str`, so the result matches `json.loads` of that text.
+pub fn value_to_json_py(py: Python<'_>, value: &Value) -> PyResult<pyo3::Py<PyAny>> {
+    let json = value
+        .to_json_value()
+        .map_err(|e| pyo3::exceptions::PyValueError::new_err(e.to_string()))?;
+    PyValue::deserialize(py, json)
+        .map(Bound::unbind)
+        .map_err(|e| {
+            pyo3::exceptions::PyValueError::new_err(format!("failed to decode value: {e}"))
+        })
+}
+
 /// Convert an isola `Value` (CBOR) to a Python object.
 pub fn value_to_py(py: Python<'_>, value: &Value) -> PyResult<pyo3::Py<PyAny>> {
     let mut decoder = minicbor::Decoder::new(value.as_cbor());
@@ -1,9 +1,12 @@
 from __future__ import annotations
 
 import asyncio
+import functools
 import io
+import json
 import os
 import tarfile
+import threading
 from pathlib import Path
 from types import SimpleNamespace
 from typing import TYPE_CHECKING, Any, cast
@@ -11,13 +14,14 @@ from typing import TYPE_CHECKING, Any, cast
 import pytest
 
 if TYPE_CHECKING:
-    from collections.abc import AsyncIterator, Awaitable, Callable
+    from collections.abc import AsyncIterator, Awaitable, Callable, Iterator
 
     from isola import HttpRequest, HttpResponse
     from isola import Sandbox as IsolaSandbox
 
 isola = pytest.importorskip("isola")
 runtime_module = pytest.importorskip("isola._runtime")
+core_module = pytest.importorskip("isola._core")
 
 _FETCH_SCRIPT = (
     "from sandbox.http import fetch\n"
@@ -35,6 +39,21 @@ def test_json_stream_from_iterable_roundtrip() -> None:
     assert stream_arg.producer_task is None
 
 
+def test_stream_capacity_none_is_unbounded() -> None:
+    async def no_values() -> AsyncIterator[int]:
+        return
+        yield
+
+    unbounded = isola.StreamArg.from_async_iterable(no_values(), capacity=None)
+    for value in range(70_000):
+        unbounded.stream_core.push(value)
+
+    bounded = isola.StreamArg.from_async_iterable(no_values(), capacity=1)
+    bounded.stream_core.push(0)
+    with pytest.raises(isola.StreamFullError):
+        bounded.stream_core.push(1)
+
+
 def test_strip_first_path_component_flattens_bundle_root() -> None:
     strip_first_path_component = runtime_module._strip_first_path_component  # ruff:ignore[private-member-access]
 
@@ -45,8 +64,7 @@ def test_strip_first_path_component_flattens_bundle_root() -> None:
     assert strip_first_path_component("isola-python-runtime") is None
 
 
-@pytest.mark.asyncio
-async def test_runtime_extraction_rejects_escaping_symlink(tmp_path: Path) -> None:
+def test_runtime_extraction_rejects_escaping_symlink(tmp_path: Path) -> None:
     archive = io.BytesIO()
     with tarfile.open(fileobj=archive, mode="w:gz") as tf:
         link = tarfile.TarInfo("isola-python-runtime/lib/escape")
@@ -55,13 +73,13 @@ async def test_runtime_extraction_rejects_escaping_symlink(tmp_path: Path) -> No
         tf.addfile(link)
 
     with pytest.raises(RuntimeError, match="symlink target escapes archive"):
-        await runtime_module._extract_tarball(  # ruff:ignore[private-member-access]
-            archive.getvalue(), tmp_path / "runtime"
+        runtime_module._unpack_tarball(  # ruff:ignore[private-member-access]
+            io.BytesIO(archive.getvalue()), tmp_path / "runtime"
         )
+    assert _dir_entries(tmp_path) == []
 
 
-@pytest.mark.asyncio
-async def test_runtime_extraction_rejects_member_below_symlink(tmp_path: Path) -> None:
+def test_runtime_extraction_rejects_member_below_symlink(tmp_path: Path) -> None:
     archive = io.BytesIO()
     with tarfile.open(fileobj=archive, mode="w:gz") as tf:
         link = tarfile.TarInfo("isola-python-runtime/lib/link")
@@ -75,11 +93,164 @@ async def test_runtime_extraction_rejects_member_below_symlink(tmp_path: Path) -
         tf.addfile(member, io.BytesIO(payload))
 
     with pytest.raises(RuntimeError, match="archive entry traverses symlink"):
-        await runtime_module._extract_tarball(  # ruff:ignore[private-member-access]
-            archive.getvalue(), tmp_path / "runtime"
+        runtime_module._unpack_tarball(  # ruff:ignore[private-member-access]
+            io.BytesIO(archive.getvalue()), tmp_path / "runtime"
+        )
+    assert _dir_entries(tmp_path) == []
+
+
+def _runtime_tarball() -> bytes:
+    archive = io.BytesIO()
+    with tarfile.open(fileobj=archive, mode="w:gz") as tf:
+        payload = os.urandom(256 * 1024)
+        member = tarfile.TarInfo("isola-python-runtime/bin/python.wasm")
+        member.size = len(payload)
+        tf.addfile(member, io.BytesIO(payload))
+    return archive.getvalue()
+
+
+def _dir_entries(path: Path) -> list[str]:
+    return sorted(entry.name for entry in path.iterdir())
+
+
+def _fake_download(
+    data: bytes, error: BaseException | None = None
+) -> Callable[..., Awaitable[None]]:
+    async def _download(
+        _version: str,
+        _tarball_name: str,
+        _expected_digest: str,
+        write: Callable[[bytes], Awaitable[object]],
+    ) -> None:
+        for start in range(0, len(data), 16 * 1024):
+            await write(data[start : start + 16 * 1024])
+            await asyncio.sleep(0)
+        if error is not None:
+            raise error
+
+    return _download
+
+
+def test_runtime_unpack_and_install(tmp_path: Path) -> None:
+    dest = tmp_path / "runtime"
+
+    tmp_dir = runtime_module._unpack_tarball(  # ruff:ignore[private-member-access]
+        io.BytesIO(_runtime_tarball()), dest
+    )
+    runtime_module._install_unpacked(tmp_dir, dest)  # ruff:ignore[private-member-access]
+
+    assert _dir_entries(dest / "bin") == ["python.wasm"]
+    assert _dir_entries(tmp_path) == ["runtime"]
+
+
+@pytest.mark.asyncio
+async def test_runtime_chunk_reader_applies_backpressure() -> None:
+    reader = runtime_module._ChunkReader()  # ruff:ignore[private-member-access]
+    for _ in range(runtime_module._READ_AHEAD_CHUNKS):  # ruff:ignore[private-member-access]
+        await reader.feed(b"a")
+
+    blocked = asyncio.create_task(reader.feed(b"b"))
+    await asyncio.sleep(0.05)
+    assert not blocked.done()
+
+    assert reader.read(1) == b"a"
+    await asyncio.wait_for(blocked, timeout=5)
+
+
+@pytest.mark.asyncio
+async def test_runtime_download_extracts_while_streaming(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    monkeypatch.setattr(
+        runtime_module, "_download_tarball", _fake_download(_runtime_tarball())
+    )
+    dest = tmp_path / "runtime"
+
+    await runtime_module._download_and_extract(  # ruff:ignore[private-member-access]
+        "0.0.0", "isola-python-runtime.tar.gz", "sha256:unused", dest
+    )
+
+    assert _dir_entries(dest / "bin") == ["python.wasm"]
+    assert _dir_entries(tmp_path) == ["runtime"]
+
+
+@pytest.mark.asyncio
+async def test_runtime_download_error_mid_stream_discards_partial_extract(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    data = _runtime_tarball()
+    monkeypatch.setattr(
+        runtime_module,
+        "_download_tarball",
+        _fake_download(data[: len(data) // 2], OSError("connection reset")),
+    )
+
+    with pytest.raises(OSError, match="connection reset"):
+        await asyncio.wait_for(
+            runtime_module._download_and_extract(  # ruff:ignore[private-member-access]
+                "0.0.0", "isola-python-runtime.tar.gz", "sha256:unused", tmp_path / "rt"
+            ),
+            timeout=10,
+        )
+
+    assert _dir_entries(tmp_path) == []
+
+
+@pytest.mark.asyncio
+async def test_runtime_download_truncated_tarball_fails(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    data = _runtime_tarball()
+    monkeypatch.setattr(
+        runtime_module, "_download_tarball", _fake_download(data[: len(data) // 2])
+    )
+
+    with pytest.raises((tarfile.ReadError, EOFError)):
+        await asyncio.wait_for(
+            runtime_module._download_and_extract(  # ruff:ignore[private-member-access]
+                "0.0.0", "isola-python-runtime.tar.gz", "sha256:unused", tmp_path / "rt"
+            ),
+            timeout=10,
+        )
+
+    assert _dir_entries(tmp_path) == []
+
+
+@pytest.mark.asyncio
+async def test_runtime_download_failure_does_not_hang_extract_thread(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    # Fails before any bytes arrive, while the extraction thread is blocked
+    # waiting for the first chunk.
+    monkeypatch.setattr(
+        runtime_module, "_download_tarball", _fake_download(b"", OSError("refused"))
+    )
+
+    with pytest.raises(OSError, match="refused"):
+        await asyncio.wait_for(
+            runtime_module._download_and_extract(  # ruff:ignore[private-member-access]
+                "0.0.0", "isola-python-runtime.tar.gz", "sha256:unused", tmp_path / "rt"
+            ),
+            timeout=10,
+        )
+
+    # Garbage stops the extractor early; the rest of the download is dropped.
+    monkeypatch.setattr(
+        runtime_module, "_download_tarball", _fake_download(b"\0" * 256 * 1024)
+    )
+
+    with pytest.raises(tarfile.ReadError):
+        await asyncio.wait_for(
+            runtime_module._download_and_extract(  # ruff:ignore[private-member-access]
+                "0.0.0", "isola-python-runtime.tar.gz", "sha256:unused", tmp_path / "rt"
+            ),
+            timeout=10,
         )
 
+    assert _dir_entries(tmp_path) == []
+
 
+@functools.cache
 def _resolve_runtime_paths() -> tuple[Path, Path]:
     workspace_root = Path(__file__).resolve().parents[3]
     runtime_dir = workspace_root / "target"
@@ -106,6 +277,7 @@ def _resolve_runtime_paths() -> tuple[Path, Path]:
     return runtime_dir, lib_dir
 
 
+@functools.cache
 def _resolve_js_runtime_dir() -> Path:
     workspace_root = Path(__file__).resolve().parents[3]
     runtime_dir = workspace_root / "target"
@@ -204,6 +376,37 @@ async def test_can_start_sandbox_and_execute_code() -> None:
         assert stream_result is None
 
 
+@pytest.mark.asyncio
+async def test_run_final_value_matches_final_json() -> None:
+    runtime_dir, lib_dir = _resolve_runtime_paths()
+    template = await isola.build_template(
+        "python",
+        runtime_path=runtime_dir,
+        max_memory=64 * 1024 * 1024,
+        runtime_lib_dir=lib_dir,
+    )
+
+    async with template.create() as sandbox:
+        await sandbox.load_script(
+            "def raw():\n"
+            "\treturn b'\\x00\\xffisola'\n"
+            "\n"
+            "def nested():\n"
+            "\treturn {'a': {'b': [1, 2.5, None, {'c': 'd'}]}, 'e': True}\n"
+            "\n"
+            "def nothing():\n"
+            "\treturn None"
+        )
+
+        for name in ("raw", "nested", "nothing"):
+            result = await sandbox._run_operation(name)  # ruff:ignore[private-member-access]
+            expected = (
+                None if result.final_json is None else json.loads(result.final_json)
+            )
+            assert result.final_value == expected
+            assert await sandbox.run(name) == expected
+
+
 @pytest.mark.asyncio
 async def test_run_stream_yields_events() -> None:
     runtime_dir, lib_dir = _resolve_runtime_paths()
@@ -360,6 +563,39 @@ async def test_run_stream_flushes_trailing_scheduled_events() -> None:
     assert events[1].data == 7
 
 
+@pytest.mark.asyncio
+async def test_run_stream_batched_groups_buffered_events() -> None:
+    class _FakeCore:
+        def __init__(self) -> None:
+            self.callback: Callable[[str, object], None] | None = None
+
+        def set_callback(self, callback: Callable[[str, object], None] | None) -> None:
+            self.callback = callback
+
+        async def run(
+            self, func: str, args: list[tuple[str, str | None, object]]
+        ) -> None:
+            _ = func
+            _ = args
+            callback = self.callback
+            assert callback is not None
+            callback("stdout", "a")
+            callback("stdout", "b")
+            await asyncio.sleep(0.01)
+            callback("end", None)
+
+        def close(self) -> None:
+            pass
+
+    sandbox = isola.Sandbox(cast("Any", _FakeCore()))
+
+    batches = [batch async for batch in sandbox.run_stream_batched("emit")]
+    assert batches == [
+        [isola.StdoutEvent(data="a"), isola.StdoutEvent(data="b")],
+        [isola.EndEvent(data=None)],
+    ]
+
+
 @pytest.mark.asyncio
 async def test_run_treats_python_list_as_single_json_argument() -> None:
     class _FakeCore:
@@ -395,7 +631,7 @@ async def test_run_treats_python_list_as_single_json_argument() -> None:
         ) -> SimpleNamespace:
             _ = func
             self.args = args
-            return SimpleNamespace(final_json="[1, 2, 3]")
+            return SimpleNamespace(final_value=[1, 2, 3])
 
         def close(self) -> None:
             pass
@@ -445,7 +681,7 @@ async def test_run_maps_kwargs_to_named_arguments() -> None:
         ) -> SimpleNamespace:
             _ = func
             self.args = args
-            return SimpleNamespace(final_json=None)
+            return SimpleNamespace(final_value=None)
 
         def close(self) -> None:
             pass
@@ -535,7 +771,7 @@ async def test_run_propagates_stream_producer_failure() -> None:
             _ = func
             _ = args
             await asyncio.sleep(0)
-            return SimpleNamespace(final_json=None)
+            return SimpleNamespace(final_value=None)
 
         @staticmethod
         def close() -> None:
@@ -554,6 +790,157 @@ async def test_run_propagates_stream_producer_failure() -> None:
         await sandbox.run("consume", stream_arg)
 
 
+@pytest.mark.asyncio
+async def test_rejected_run_stops_blocking_stream_producer() -> None:
+    class _FakeCore:
+        @staticmethod
+        async def run(
+            func: str, args: list[tuple[str, str | None, object]]
+        ) -> SimpleNamespace:
+            _ = func
+            _ = args
+            message = "sandbox is busy"
+            raise isola.InvalidArgumentError(message)
+
+        @staticmethod
+        def close() -> None:
+            pass
+
+    sandbox = isola.Sandbox(cast("Any", _FakeCore()))
+    # The core never takes the receiver, so the producer must not stay parked
+    # on the full stream after run() fails.
+    stream_arg = isola.StreamArg.from_iterable(range(200_000), capacity=1)
+
+    with pytest.raises(isola.InvalidArgumentError, match="sandbox is busy"):
+        await sandbox.run("consume", stream_arg)
+
+    producer = stream_arg.producer_task
+    assert producer is not None
+    assert producer.done()
+    with pytest.raises(isola.StreamClosedError):
+        stream_arg.stream_core.push(0)
+
+
+@pytest.mark.asyncio
+async def test_blocking_stream_producer_ends_stream_on_iterator_error() -> None:
+    def values() -> Iterator[int]:
+        yield 1
+        yield 2
+        message = "iterator failed"
+        raise RuntimeError(message)
+
+    stream_arg = isola.StreamArg.from_iterable(values())
+    producer = stream_arg.start_producer()
+    assert producer is not None
+
+    with pytest.raises(RuntimeError, match="iterator failed"):
+        await asyncio.wait_for(producer, timeout=5)
+    with pytest.raises(isola.StreamClosedError):
+        stream_arg.stream_core.push(3)
+
+
+@pytest.mark.asyncio
+async def test_blocking_stream_producer_runs_outside_shared_pool() -> None:
+    thread_names: list[str] = []
+
+    def values() -> Iterator[int]:
+        thread_names.append(threading.current_thread().name)
+        yield 1
+
+    producer = isola.StreamArg.from_iterable(values()).start_producer()
+    assert producer is not None
+    await asyncio.wait_for(producer, timeout=5)
+
+    assert thread_names == ["isola-stream"]
+
+
+@pytest.mark.parametrize("value", ["0", "-1", "many"])
+def test_isola_threads_must_be_positive_integer(
+    monkeypatch: pytest.MonkeyPatch, value: str
+) -> None:
+    monkeypatch.setenv("ISOLA_THREADS", value)
+
+    with pytest.raises(ValueError, match="ISOLA_THREADS must be a positive integer"):
+        core_module._executor_size()  # ruff:ignore[private-member-access]
+
+
+@pytest.mark.asyncio
+async def test_blocking_stream_producer_rejects_non_iterable() -> None:
+    not_iterable: Any = 42
+    with pytest.raises(TypeError):
+        isola.StreamArg.from_iterable([]).stream_core.push_many(not_iterable)
+
+    stream_arg = isola.StreamArg.from_iterable(not_iterable)
+    producer = stream_arg.start_producer()
+    assert producer is not None
+
+    with pytest.raises(TypeError):
+        await asyncio.wait_for(producer, timeout=5)
+    with pytest.raises(isola.StreamClosedError):
+        stream_arg.stream_core.push(1)
+
+
+@pytest.mark.asyncio
+async def test_blocking_stream_producer_stops_when_receiver_is_dropped() -> None:
+    runtime_dir, lib_dir = _resolve_runtime_paths()
+    template = await isola.build_template(
+        "python",
+        runtime_path=runtime_dir,
+        max_memory=64 * 1024 * 1024,
+        runtime_lib_dir=lib_dir,
+    )
+
+    async with template.create() as sandbox:
+        await sandbox.load_script("def ignore(values):\n\treturn 'ignored'")
+
+        # The guest never reads, so the worker thread parks on a full stream
+        # until the call ends and drops the receiver.
+        stream_arg = isola.StreamArg.from_iterable(range(10_000), capacity=1)
+        with pytest.raises(isola.StreamClosedError):
+            await asyncio.wait_for(sandbox.run("ignore", stream_arg), timeout=10)
+
+
+@pytest.mark.asyncio
+async def test_closing_stream_wakes_blocked_producer_during_run() -> None:
+    runtime_dir, lib_dir = _resolve_runtime_paths()
+    template = await isola.build_template(
+        "python",
+        runtime_path=runtime_dir,
+        max_memory=64 * 1024 * 1024,
+        runtime_lib_dir=lib_dir,
+    )
+    release = asyncio.Event()
+
+    async def wait(payload: object) -> object:
+        _ = payload
+        await release.wait()
+        return None
+
+    async with template.create(hostcalls={"wait": wait}) as sandbox:
+        await sandbox.load_script(
+            "from sandbox.asyncio import hostcall\n"
+            "\n"
+            "async def stall(values):\n"
+            "\treturn await hostcall('wait', None)\n"
+        )
+
+        # The run holds the receiver but never reads from it.
+        stream_arg = isola.StreamArg.from_iterable(range(10_000), capacity=1)
+        run = asyncio.create_task(sandbox.run("stall", stream_arg))
+        await asyncio.sleep(0.1)
+        producer = stream_arg.producer_task
+        assert producer is not None
+        assert not producer.done()
+
+        stream_arg.stream_core.close()
+        with pytest.raises(isola.StreamClosedError):
+            await asyncio.wait_for(producer, timeout=5)
+
+        release.set()
+        with pytest.raises(isola.StreamClosedError):
+            await asyncio.wait_for(run, timeout=10)
+
+
 @pytest.mark.asyncio
 async def test_two_sandboxes_can_run_concurrently() -> None:
     runtime_dir, lib_dir = _resolve_runtime_paths()
@@ -649,6 +1036,88 @@ async def test_template_create_configures_http_handler() -> None:
     assert core.http_loop is asyncio.get_running_loop()
 
 
+@pytest.mark.asyncio
+async def test_default_http_handler_reuses_client_until_close(
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    httpx = pytest.importorskip("httpx")
+
+    class _FakeCore:
+        def __init__(self) -> None:
+            self.http_handler: (
+                Callable[
+                    [str, str, dict[str, str], bytes | None],
+                    Awaitable[tuple[int, dict[str, str], str, object]],
+                ]
+                | None
+            ) = None
+
+        def configure(self, _: object) -> None:
+            pass
+
+        def set_callback(self, _: Callable[[str, object], None] | None) -> None:
+            pass
+
+        def set_http_handler(
+            self,
+            callback: Callable[
+                [str, str, dict[str, str], bytes | None],
+                Awaitable[tuple[int, dict[str, str], str, object]],
+            ]
+            | None,
+            event_loop: asyncio.AbstractEventLoop | None,
+        ) -> None:
+            _ = event_loop
+            self.http_handler = callback
+
+        @staticmethod
+        def set_hostcall_handler(
+            callback: Callable[[str, object], Awaitable[object]] | None,
+            event_loop: asyncio.AbstractEventLoop | None,
+        ) -> None:
+            _ = callback
+            _ = event_loop
+
+        def close(self) -> None:
+            pass
+
+    class _FakeContextCore:
+        def __init__(self, sandbox_core: _FakeCore) -> None:
+            self.sandbox_core = sandbox_core
+
+        async def instantiate(self) -> _FakeCore:
+            return self.sandbox_core
+
+    clients: list[Any] = []
+    async_client = httpx.AsyncClient
+    transport = httpx.MockTransport(lambda _: httpx.Response(200, content=b"ok"))
+
+    def _client() -> object:
+        client = async_client(transport=transport)
+        clients.append(client)
+        return client
+
+    monkeypatch.setattr(httpx, "AsyncClient", _client)
+
+    core = _FakeCore()
+    template = isola.SandboxTemplate(cast("Any", _FakeContextCore(core)))
+    sandbox = await template.instantiate(http=True)
+    assert core.http_handler is not None
+
+    for _ in range(2):
+        status, _headers, _kind, body = await core.http_handler(
+            "GET", "http://example.test/", {}, None
+        )
+        assert status == 200
+        assert body == b"ok"
+
+    assert len(clients) == 1
+    assert not clients[0].is_closed
+
+    await sandbox.aclose()
+    assert clients[0].is_closed
+
+
 @pytest.mark.asyncio
 async def test_template_create_rejects_invalid_http_handler() -> None:
     class _FakeCore:
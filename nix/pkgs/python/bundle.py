@@ -2,17 +2,27 @@
 
 from __future__ import annotations
 
+import contextlib
+import os
 import pathlib
 import py_compile
 import sys
 import tempfile
 import zipfile
+from concurrent.futures import ProcessPoolExecutor
 from typing import TYPE_CHECKING
 
 if TYPE_CHECKING:
     from collections.abc import Iterator
 
 
+def sorted_entries(directory: pathlib.Path) -> list[os.DirEntry[str]]:
+    # scandir() reports entry types from the directory listing itself, so
+    # the is_file()/is_dir() checks below do not stat every child.
+    with os.scandir(directory) as entries:
+        return sorted(entries, key=lambda entry: entry.name)
+
+
 def python_sources(
     source: pathlib.Path,
     archive_path: pathlib.PurePosixPath,
@@ -27,13 +37,15 @@ def python_sources(
         return
 
     yield init, archive_path / "__init__.py"
-    for child in sorted(source.iterdir()):
-        if child == init:
+    for child in sorted_entries(source):
+        if child.name == init.name:
             continue
-        if child.is_file() and child.suffix == ".py":
-            yield child, archive_path / child.name
+        if child.is_file() and child.name.endswith(".py"):
+            yield pathlib.Path(child.path), archive_path / child.name
         elif child.is_dir():
-            yield from python_sources(child, archive_path / child.name)
+            yield from python_sources(
+                pathlib.Path(child.path), archive_path / child.name
+            )
 
 
 def top_level_python_sources(
@@ -41,30 +53,41 @@ def top_level_python_sources(
     *,
     exclude_wheel_metadata: bool = False,
 ) -> Iterator[tuple[pathlib.Path, pathlib.PurePosixPath]]:
-    for item in sorted(root.iterdir()):
+    for item in sorted_entries(root):
         if exclude_wheel_metadata and item.name.endswith((".dist-info", ".data")):
             continue
-        if item.is_dir() and not (item / "__init__.py").is_file():
-            for child in sorted(item.iterdir()):
-                if child.is_file() and child.suffix == ".py":
-                    yield child, pathlib.PurePosixPath(child.name)
+        path = pathlib.Path(item.path)
+        if item.is_dir() and not (path / "__init__.py").is_file():
+            for child in sorted_entries(path):
+                if child.is_file() and child.name.endswith(".py"):
+                    yield pathlib.Path(child.path), pathlib.PurePosixPath(child.name)
         else:
-            yield from python_sources(item, pathlib.PurePosixPath(item.name))
+            yield from python_sources(path, pathlib.PurePosixPath(item.name))
+
+
+def compile_source(
+    job: tuple[pathlib.Path, pathlib.PurePosixPath, pathlib.Path],
+) -> None:
+    source, archive_source, compiled_path = job
+    try:
+        py_compile.compile(
+            source,
+            cfile=compiled_path,
+            dfile=archive_source.as_posix(),
+            doraise=True,
+            invalidation_mode=py_compile.PycInvalidationMode.CHECKED_HASH,
+        )
+    except py_compile.PyCompileError as exc:
+        # PyCompileError cannot be pickled back to the parent; without this
+        # the pool only reports a broken worker.
+        raise RuntimeError(exc.msg) from None
 
 
 def write_bytecode(
     archive: zipfile.ZipFile,
-    source: pathlib.Path,
     archive_source: pathlib.PurePosixPath,
     compiled_path: pathlib.Path,
 ) -> None:
-    py_compile.compile(
-        source,
-        cfile=compiled_path,
-        dfile=archive_source.as_posix(),
-        doraise=True,
-        invalidation_mode=py_compile.PycInvalidationMode.CHECKED_HASH,
-    )
     archive_name = archive_source.with_suffix(".pyc").as_posix()
     info = zipfile.ZipInfo(archive_name, date_time=(1980, 1, 1, 0, 0, 0))
     info.compress_type = zipfile.ZIP_DEFLATED
@@ -86,31 +109,36 @@ if __name__ == "__main__":
             strict_timestamps=False,
         ) as archive,
         tempfile.TemporaryDirectory() as compile_dir,
+        contextlib.ExitStack() as wheel_dirs,
     ):
-        compiled_path = pathlib.Path(compile_dir) / "module.pyc"
+        sources: list[tuple[pathlib.Path, pathlib.PurePosixPath]] = []
         for path_str in source_paths:
             path = pathlib.Path(path_str)
 
             if path.is_file() and path.suffix == ".whl":
-                with tempfile.TemporaryDirectory() as tmpdir:
-                    with zipfile.ZipFile(path, "r") as whl:
-                        whl.extractall(tmpdir)
-                    root = pathlib.Path(tmpdir)
-                    for source, archive_source in top_level_python_sources(
-                        root,
+                tmpdir = wheel_dirs.enter_context(tempfile.TemporaryDirectory())
+                with zipfile.ZipFile(path, "r") as whl:
+                    whl.extractall(tmpdir)
+                sources.extend(
+                    top_level_python_sources(
+                        pathlib.Path(tmpdir),
                         exclude_wheel_metadata=True,
-                    ):
-                        write_bytecode(
-                            archive,
-                            source,
-                            archive_source,
-                            compiled_path,
-                        )
-            elif path.is_dir():
-                for source, archive_source in top_level_python_sources(path):
-                    write_bytecode(
-                        archive,
-                        source,
-                        archive_source,
-                        compiled_path,
                     )
+                )
+            elif path.is_dir():
+                sources.extend(top_level_python_sources(path))
+
+        # Compiling dominates the build and every module is independent, so
+        # spread it across processes, then write the archive in source order
+        # to keep it reproducible.
+        jobs = [
+            (source, archive_source, pathlib.Path(compile_dir) / f"{index}.pyc")
+            for index, (source, archive_source) in enumerate(sources)
+        ]
+        # NIX_BUILD_CORES is the builder's core limit; 0 means all cores.
+        workers = int(os.environ.get("NIX_BUILD_CORES", "0")) or None
+        with ProcessPoolExecutor(max_workers=workers) as executor:
+            for _ in executor.map(compile_source, jobs, chunksize=16):
+                pass
+        for _, archive_source, compiled_path in jobs:
+            write_bytecode(archive, archive_source, compiled_path)